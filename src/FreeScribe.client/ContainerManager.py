@@ -10,18 +10,56 @@ Prof. Michael Yingbull (PI), Dr. Braedon Hendy (Partner),
 and Research Students - Software Developer Alex Simko, Pemba Sherpa (F24), and Naitik Patel.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 import docker
-import asyncio
-import time
+import threading
 
 from utils.log_config import logger
 
+CONTAINER_EVENTS = ("start", "stop", "die")  # Docker events that change whether a container is running
+DOCKER_CLIENT_TIMEOUT = 5  # Seconds to wait for a response from the Docker daemon
+DOCKER_MAX_POOL_SIZE = 8  # Kept-alive daemon connections: the event stream, concurrent start/stop calls and status checks
+CONTAINER_OPERATION_WORKERS = 5  # Enough to start or stop every LLM and Whisper container at once
+
+# Threads are created on demand and reused, so repeated start/stop clicks do not spawn new ones
+_CONTAINER_EXECUTOR = ThreadPoolExecutor(max_workers=CONTAINER_OPERATION_WORKERS, thread_name_prefix="container-op")
+
+_SHARED_CLIENT = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _get_shared_client():
+    """
+    Get the Docker client shared by every ContainerManager, creating it on first use.
+
+    Creating a client re-reads the Docker environment and opens a new connection
+    pool, so one client is reused for the lifetime of the application. Its pool
+    keeps connections to the daemon alive between requests, and every request
+    except the event stream times out after DOCKER_CLIENT_TIMEOUT seconds.
+
+    :return: The shared Docker client, or None if Docker is not reachable.
+    :rtype: docker.DockerClient | None
+    """
+    global _SHARED_CLIENT
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is None:
+            try:
+                _SHARED_CLIENT = docker.from_env(timeout=DOCKER_CLIENT_TIMEOUT, max_pool_size=DOCKER_MAX_POOL_SIZE)
+            except docker.errors.DockerException as e:
+                logger.debug(f"Docker client unavailable: {e}")
+        return _SHARED_CLIENT
+
 
 class ContainerState(Enum):
     CONTAINER_STOPPED = "ContainerStopped"
     CONTAINER_STARTED = "ContainerStarted"
 
+STATUS_ICON_COLORS = {
+    ContainerState.CONTAINER_STARTED: 'green',
+    ContainerState.CONTAINER_STOPPED: 'red',
+}
+
 class ContainerManager:
     """
     Manages Docker containers by starting and stopping them.
@@ -31,6 +69,8 @@ class ContainerManager:
 
     Attributes:
         client (docker.DockerClient): The Docker client used to interact with containers.
+        _container_states (dict | None): Maps container names to whether they are running,
+            kept current from the event stream while watch_events runs, otherwise None.
     """
 
     def __init__(self):
@@ -38,11 +78,9 @@ class ContainerManager:
         Initialize the ContainerManager with a Docker client.
         """
         self.client = None
-
-        try:
-            self.client = docker.from_env()
-        except docker.errors.DockerException as e:
-            self.client = None
+        self._event_stream = None
+        self._container_states = None
+        self.client = _get_shared_client()
 
     def start_container(self, container_name):
         """
@@ -54,14 +92,53 @@ class ContainerManager:
         :raises docker.errors.APIError: If an error occurs while starting the container.
         """
         try:
-            container = self.client.containers.get(container_name)
-            container.start()
+            self.client.api.start(container_name)
             return ContainerState.CONTAINER_STARTED
         except docker.errors.NotFound as e:
             raise docker.errors.NotFound(f"Container {container_name} not found.") from e
         except docker.errors.APIError as e:
             raise docker.errors.APIError(f"An error occurred while starting the container: {e}") from e
 
+    def start_containers(self, container_names):
+        """
+        Start several Docker containers concurrently.
+
+        Each start is a blocking request to the Docker daemon, so the requests are
+        issued in parallel and the total wait is roughly that of the slowest one.
+
+        :param container_names: The names of the containers to start.
+        :type container_names: list[str]
+        :return: The resulting state of each container, in the order given.
+        :rtype: list[ContainerState]
+        :raises docker.errors.NotFound: If any of the containers is not found.
+        :raises docker.errors.APIError: If an error occurs while starting a container.
+        """
+        return self._run_concurrently(self.start_container, container_names)
+
+    def stop_containers(self, container_names):
+        """
+        Stop several Docker containers concurrently.
+
+        :param container_names: The names of the containers to stop.
+        :type container_names: list[str]
+        :return: The resulting state of each container, in the order given.
+        :rtype: list[ContainerState]
+        :raises docker.errors.NotFound: If any of the containers is not found.
+        :raises docker.errors.APIError: If an error occurs while stopping a container.
+        """
+        return self._run_concurrently(self.stop_container, container_names)
+
+    def _run_concurrently(self, operation, container_names):
+        """
+        Apply a container operation to each name on the shared container worker pool.
+
+        :param operation: The per-container method to call.
+        :param container_names: The names of the containers to operate on.
+        :return: The results of the operation, in the order given.
+        :rtype: list
+        """
+        return list(_CONTAINER_EXECUTOR.map(operation, container_names))
+
     def update_container_status_icon(self, dot, container_name):
         """Update the status icon for a Docker container based on its current state.
 
@@ -108,8 +185,7 @@ class ContainerManager:
         :raises docker.errors.APIError: If an error occurs while stopping the container.
         """
         try:
-            container = self.client.containers.get(container_name)
-            container.stop()
+            self.client.api.stop(container_name)
             logger.info(f"Container {container_name} stopped successfully.")
             return ContainerState.CONTAINER_STOPPED
         except docker.errors.NotFound as e:
@@ -121,6 +197,9 @@ class ContainerManager:
         """
         Check the status of a Docker container by its name.
 
+        While watch_events is running the answer comes from the tracked states
+        without contacting the daemon.
+
         :param container_name: The name of the container to check.
         :type container_name: str
         :return: True if the container is running, False otherwise.
@@ -128,12 +207,11 @@ class ContainerManager:
         :raises docker.errors.NotFound: If the specified container is not found.
         :raises docker.errors.APIError: If an error occurs while checking the container status.
         """
-        try:
-            container = self.client.containers.get(container_name)
-            status = container.status
-
-            return status == "running"
+        if self._container_states is not None:
+            return self._container_states.get(container_name, False)
 
+        try:
+            return self.client.api.inspect_container(container_name)["State"]["Running"]
         except docker.errors.NotFound:
             logger.error(f"Container {container_name} not found.")
             return False
@@ -144,6 +222,78 @@ class ContainerManager:
             logger.error(f"An error occurred while checking the container status: {e}")
             return False
 
+    def check_containers_status(self, container_names):
+        """
+        Check the status of several Docker containers with a single list request.
+
+        While watch_events is running the answer comes from the tracked states
+        without contacting the daemon.
+
+        The daemon's name filter matches substrings, so results are matched back to
+        the requested names exactly. Containers that do not exist are reported as
+        not running.
+
+        :param container_names: The names of the containers to check.
+        :type container_names: list[str]
+        :return: A mapping of each container name to True if it is running, False otherwise.
+        :rtype: dict[str, bool]
+        """
+        if self._container_states is not None:
+            return {name: self._container_states.get(name, False) for name in container_names}
+
+        statuses = dict.fromkeys(container_names, False)
+        try:
+            containers = self.client.containers.list(all=True, filters={"name": list(container_names)})
+        except Exception as e:
+            logger.error(f"An error occurred while checking the container statuses: {e}")
+            return statuses
+
+        for container in containers:
+            if container.name in statuses:
+                statuses[container.name] = container.status == "running"
+
+        return statuses
+
+    def watch_events(self, callback):
+        """
+        Block and report container state changes from the Docker event stream.
+
+        Runs until stop_watching_events is called or the Docker daemon goes away, so
+        it is meant to be called from a background thread. The callback is invoked
+        on that thread. While running, the state of every container is tracked in
+        memory so status checks need no daemon requests.
+
+        :param callback: Called with the container name and its new ContainerState.
+        :type callback: Callable[[str, ContainerState], None]
+        """
+        if self.client is None:
+            return
+
+        try:
+            # Subscribe before listing so no change between the two is missed
+            self._event_stream = self.client.events(decode=True, filters={"type": "container", "event": list(CONTAINER_EVENTS)})
+            self._container_states = {container.name: container.status == "running" for container in self.client.containers.list(all=True)}
+            for event in self._event_stream:
+                container_name = event.get("Actor", {}).get("Attributes", {}).get("name")
+                if container_name is None:
+                    continue
+
+                running = event.get("Action") == "start"
+                self._container_states[container_name] = running
+                callback(container_name, ContainerState.CONTAINER_STARTED if running else ContainerState.CONTAINER_STOPPED)
+        except Exception as e:
+            logger.info(f"Docker event stream closed: {e}")
+        finally:
+            self._event_stream = None
+            self._container_states = None
+
+    def stop_watching_events(self):
+        """
+        Close the Docker event stream, ending any running watch_events call.
+        """
+        if self._event_stream is not None:
+            self._event_stream.close()
+
     def set_status_icon_color(self, widget, status: ContainerState):
         """
         Set the color of the status icon based on the status of the container.
@@ -153,13 +303,14 @@ class ContainerManager:
         :param status: The status of the container.
         :type status: ContainerState
         """
-        if status not in ContainerState:
+        if not isinstance(status, ContainerState):
             raise ValueError(f"Invalid container state: {status}")
         
-        if status == ContainerState.CONTAINER_STARTED:
-            widget.config(fg='green')
-        elif status == ContainerState.CONTAINER_STOPPED:
-            widget.config(fg='red')
+        color = STATUS_ICON_COLORS[status]
+
+        # Reconfiguring redraws the widget, so skip it when the color is already right
+        if widget.cget('fg') != color:
+            widget.config(fg=color)
 
     def check_docker_availability(self):
         """
@@ -168,9 +319,12 @@ class ContainerManager:
         :return: True if the Docker client is available, False otherwise.
         :rtype: bool
         """
-        try:
-            self.client = docker.from_env()
-        except docker.errors.DockerException as e:
-            self.client = None
-            
+        self.client = _get_shared_client()
+        if self.client is not None:
+            try:
+                self.client.ping()
+            except Exception as e:
+                logger.debug(f"Docker daemon did not respond: {e}")
+                self.client = None
+
         return self.client is not None
\ No newline at end of file
@@ -10,6 +10,7 @@ from enum import Enum
 import torch
 import utils.system
 from utils.file_utils import get_resource_path, is_flatpak
+from utils.model_events import model_load_finished
 
 
 
@@ -177,7 +178,7 @@ class ModelManager:
     local_model = None
 
     @staticmethod
-    def setup_model(app_settings, root, on_cancel: callable = None):
+    def setup_model(app_settings, root, on_cancel: callable = None, unlock_settings_menu: bool = True):
         """
         Initialize and load the LLM model based on application settings.
 
@@ -188,6 +189,9 @@ class ModelManager:
         Args:
             app_settings: Application settings object containing model preferences
             root: Tkinter root window for creating the loading dialog
+            on_cancel: Called when the user cancels the load
+            unlock_settings_menu: Re-enable the settings menu when loading ends. Pass False
+                when the caller unlocks it itself, e.g. after waiting for every startup model
 
         Raises:
             ValueError: If the specified model file cannot be loaded
@@ -257,6 +261,8 @@ class ModelManager:
                 root.after(100, lambda: show_error(local_exception))
 
                 ModelManager.local_model = ModelStatus.ERROR
+            finally:
+                model_load_finished.set()
 
         thread = threading.Thread(target=load_model)
         thread.start()
@@ -273,7 +279,8 @@ class ModelManager:
             if thread.is_alive():
                 root.after(500, lambda: check_thread_status(thread, loading_window, root))
             else:
-                app_settings.main_window.enable_settings_menu()
+                if unlock_settings_menu:
+                    app_settings.main_window.enable_settings_menu()
                 loading_window.destroy()
 
         root.after(500, lambda: check_thread_status(thread, loading_window, root))
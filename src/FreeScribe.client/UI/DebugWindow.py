@@ -7,7 +7,6 @@ and a debug window interface built with tkinter.
 
 import tkinter as tk
 from utils.log_config import buffer_handler
-from utils.utils import bring_to_front
 
 
 class DebugPrintWindow:
@@ -26,10 +25,7 @@ class DebugPrintWindow:
         :type parent: tk.Tk or tk.Toplevel
         """
         self.parent = parent
-        if self.parent.debug_window_open:
-            OneInstance.bring_to_front("Debug Output")
-            return
-        self.parent.debug_window_open = True
+        self._displayed_content = None  # Last buffer content written to the text widget
         self.window = tk.Toplevel(parent.root)
         self.window.title("Debug Output")
         self.window.geometry("650x450")
@@ -70,7 +66,6 @@ class DebugPrintWindow:
         content = self.text_widget.get("1.0", tk.END).strip()
         self.window.clipboard_clear()
         self.window.clipboard_append(content)
-        self.window.update_idletasks()
 
 
     def refresh_output(self):
@@ -81,14 +76,23 @@ class DebugPrintWindow:
         if there are changes in the buffer.
         """
         content = buffer_handler.get_buffer_content()
-        current_content = self.text_widget.get("1.0", tk.END).strip()
 
-        if content != current_content:
+        # Compare against what was last written instead of reading the whole widget back
+        if content != self._displayed_content:
             top_line_index = self.text_widget.index("@0,0")
-            self.text_widget.delete("1.0", tk.END)
-            self.text_widget.insert(tk.END, content)
+            self.text_widget.replace("1.0", tk.END, content)
             self.text_widget.see(top_line_index)
+            self._displayed_content = content
+
+    def show(self):
+        """
+        Show the window again after it was closed, with the latest buffer contents.
+        """
+        self.refresh_output()
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
 
     def close_window(self):
-        self.parent.debug_window_open = False
-        self.window.destroy()
+        # Hide instead of destroying so reopening does not rebuild the widgets
+        self.window.withdraw()
@@ -46,10 +46,10 @@ class LogWindow:
     def _start_decrypt_thread(self, callback):
         def target():
             try:
-                lines = self._decrypt_file()
-                self.root.after(0, lambda: callback(result=lines))
+                text = self._decrypt_file()
+                self.root.after(0, lambda: callback(result=text))
             except Exception as e:
-                self.root.after(0, lambda: callback(error=e))
+                self.root.after(0, lambda error=e: callback(error=error))
 
         t = threading.Thread(target=target, daemon=True)
         t.start()
@@ -64,16 +64,16 @@ class LogWindow:
             if not enc:
                 continue
             try:
-                out.append(AESCryptoUtilsClass.decrypt(enc) + "\n")
+                out.append(AESCryptoUtilsClass.decrypt(enc))
             except Exception as ex:
-                out.append(f"[Failed to decrypt line]: {ex}\n")
-        return out
+                out.append(f"[Failed to decrypt line]: {ex}")
+        # Join once here on the worker thread so the UI thread only has to insert
+        return "\n".join(out) + "\n" if out else ""
 
-    def _update_text_widget(self, lines):
+    def _update_text_widget(self, text):
         #check if text widget is  exist
         if self.text_widget.winfo_exists():
-            self.text_widget.delete("1.0", tk.END)
-            self.text_widget.insert(tk.END, "".join(lines))
+            self.text_widget.replace("1.0", tk.END, text)
             
     def copy_to_clipboard(self):
         content = self.text_widget.get(1.0, tk.END)
@@ -35,91 +35,126 @@ class MainWindow:
         """
         self.container_manager = ContainerManager()
         self.settings = settings
+        self._llm_names = ()  # Names of the LLM containers, resolved from the settings
+        self._whisper_names = ()  # Names of the Whisper containers, resolved from the settings
+        self.update_container_names()
 
-    def start_LLM_container(self, widget_name, app_settings):
+    def start_LLM_container(self, widget_name):
         """
         Start the LLM container.
 
         :param widget_name: The name of the widget to update with the container status.
         :type widget_name: str
-        :param app_settings: The application settings containing container names.
-        :type app_settings: ApplicationSettings
+
+        Safe to call from a worker thread; widget updates are scheduled on the Tk thread.
         """
         try:
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.start_container(app_settings.editable_settings["LLM Container Name"]))
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.start_container(app_settings.editable_settings["LLM Caddy Container Name"]))
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.start_container(app_settings.editable_settings["LLM Authentication Container Name"]))
+            states = self.container_manager.start_containers(self._llm_names)
+            widget_name.after(0, self._show_container_states, widget_name, states)
         except Exception as e:
             logger.exception("Failed to start LLM container: %s", e)
-            tk.messagebox.showerror("Error", f"An error occurred while starting the LLM container: {e}")
+            widget_name.after(0, tk.messagebox.showerror, "Error", f"An error occurred while starting the LLM container: {e}")
 
-    def stop_LLM_container(self, widget_name, app_settings):
+    def stop_LLM_container(self, widget_name):
         """
         Stop the LLM container.
 
         :param widget_name: The name of the widget to update with the container status.
         :type widget_name: str
-        :param app_settings: The application settings containing container names.
-        :type app_settings: ApplicationSettings
+
+        Safe to call from a worker thread; widget updates are scheduled on the Tk thread.
         """
         try:
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.stop_container(app_settings.editable_settings["LLM Container Name"]))
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.stop_container(app_settings.editable_settings["LLM Caddy Container Name"]))
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.stop_container(app_settings.editable_settings["LLM Authentication Container Name"]))
+            states = self.container_manager.stop_containers(self._llm_names)
+            widget_name.after(0, self._show_container_states, widget_name, states)
         except Exception as e:
             logger.exception("Failed to stop LLM container")
-            tk.messagebox.showerror("Error", f"An error occurred while stopping the LLM container: {e}")
+            widget_name.after(0, tk.messagebox.showerror, "Error", f"An error occurred while stopping the LLM container: {e}")
 
-    def start_whisper_container(self, widget_name, app_settings):
+    def start_whisper_container(self, widget_name):
         """
         Start the Whisper container.
 
         :param widget_name: The name of the widget to update with the container status.
         :type widget_name: str
-        :param app_settings: The application settings containing container names.
-        :type app_settings: ApplicationSettings
+
+        Safe to call from a worker thread; widget updates are scheduled on the Tk thread.
         """
         try:
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.start_container(app_settings.editable_settings["Whisper Container Name"]))
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.start_container(app_settings.editable_settings["Whisper Caddy Container Name"]))
+            states = self.container_manager.start_containers(self._whisper_names)
+            widget_name.after(0, self._show_container_states, widget_name, states)
         except Exception as e:
             logger.exception("Failed to start Whisper container")
-            tk.messagebox.showerror("Error", f"An error occurred while starting the Whisper container: {e}")
+            widget_name.after(0, tk.messagebox.showerror, "Error", f"An error occurred while starting the Whisper container: {e}")
 
-    def stop_whisper_container(self, widget_name, app_settings):
+    def stop_whisper_container(self, widget_name):
         """
         Stop the Whisper container.
 
         :param widget_name: The name of the widget to update with the container status.
         :type widget_name: str
-        :param app_settings: The application settings containing container names.
-        :type app_settings: ApplicationSettings
+
+        Safe to call from a worker thread; widget updates are scheduled on the Tk thread.
         """
         try:
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.stop_container(app_settings.editable_settings["Whisper Container Name"]))
-            self.container_manager.set_status_icon_color(widget_name, self.container_manager.stop_container(app_settings.editable_settings["Whisper Caddy Container Name"]))
+            states = self.container_manager.stop_containers(self._whisper_names)
+            widget_name.after(0, self._show_container_states, widget_name, states)
         except Exception as e:
             logger.exception("Failed to stop Whisper container")
-            tk.messagebox.showerror("Error", f"An error occurred while stopping the Whisper container: {e}")
+            widget_name.after(0, tk.messagebox.showerror, "Error", f"An error occurred while stopping the Whisper container: {e}")
+
+    def _show_container_states(self, widget, states):
+        """
+        Update a status icon with the combined state of a container group. Must run on the Tk thread.
+
+        The group shows as started only if every container in it started.
+
+        :param widget: The status icon widget.
+        :param states: The resulting state of each container in the group.
+        :type states: list[ContainerState]
+        """
+        started = all(state == ContainerState.CONTAINER_STARTED for state in states)
+        self.container_manager.set_status_icon_color(widget, ContainerState.CONTAINER_STARTED if started else ContainerState.CONTAINER_STOPPED)
+
+    def update_container_names(self):
+        """
+        Resolve the container names from the settings.
+
+        Must be called again whenever the container name settings change.
+        """
+        self._llm_names = (
+            self.settings.editable_settings["LLM Container Name"],
+            self.settings.editable_settings["LLM Caddy Container Name"],
+            self.settings.editable_settings["LLM Authentication Container Name"]
+        )
+        self._whisper_names = (
+            self.settings.editable_settings["Whisper Container Name"],
+            self.settings.editable_settings["Whisper Caddy Container Name"]
+        )
+
+    def llm_container_names(self):
+        """
+        Get the names of the LLM containers.
+        """
+        return self._llm_names
+
+    def whisper_container_names(self):
+        """
+        Get the names of the Whisper containers.
+        """
+        return self._whisper_names
 
     def check_llm_containers(self):
         """
         Check the status of the LLM containers.
         """
-        status_check = all([
-            self.container_manager.check_container_status(self.settings.editable_settings["LLM Container Name"]),
-            self.container_manager.check_container_status(self.settings.editable_settings["LLM Caddy Container Name"]),
-            self.container_manager.check_container_status(self.settings.editable_settings["LLM Authentication Container Name"])
-        ])
+        status_check = all(self.container_manager.check_containers_status(self._llm_names).values())
         return ContainerState.CONTAINER_STARTED if status_check else ContainerState.CONTAINER_STOPPED
 
     def check_whisper_containers(self):
         """
         Check the status of the Whisper containers.
         """
-        status_check = all([
-            self.container_manager.check_container_status(self.settings.editable_settings["Whisper Container Name"]),
-            self.container_manager.check_container_status(self.settings.editable_settings["Whisper Caddy Container Name"])
-        ])
+        status_check = all(self.container_manager.check_containers_status(self._whisper_names).values())
 
         return ContainerState.CONTAINER_STARTED if status_check else ContainerState.CONTAINER_STOPPED 
\ No newline at end of file
@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk
 from UI.SettingsConstant import SettingsKeys
@@ -5,8 +7,6 @@ import UI.Helpers
 import UI.MainWindow as mw
 from UI.ImageWindow import ImageWindow
 from UI.SettingsConstant import FeatureToggle
-from UI.SettingsWindowUI import SettingsWindowUI
-from UI.MarkdownWindow import MarkdownWindow
 from UI.Widgets.ActionResultsWindow import ActionResultsWindow
 from services.intent_actions.manager import IntentActionManager
 from utils.file_utils import get_file_path
@@ -17,7 +17,6 @@ from UI.SettingsWindow import SettingsWindow
 from utils.log_config import logger
 from pathlib import Path
 
-DOCKER_CONTAINER_CHECK_INTERVAL = 10000  # Interval in milliseconds to check the Docker container status
 DOCKER_DESKTOP_CHECK_INTERVAL = 10000  # Interval in milliseconds to check the Docker Desktop status
 
 class MainWindowUI:
@@ -41,9 +40,9 @@ class MainWindowUI:
         self.is_status_bar_enabled = False  # Flag to indicate if the Docker status bar is enabled
         self.app_settings = settings  # Application settings
         self.logic = mw.MainWindow(self.app_settings)  # Logic to control the container behavior
-        self.setting_window = SettingsWindowUI(self.app_settings, self, self.root)  # Settings window
+        self._setting_window = None  # Settings window, created on first use
         UI.Helpers.set_window_icon(self.root)
-        self.debug_window_open = False  # Flag to indicate if the debug window is open
+        self.debug_window = None  # Debug output window, created on first use and hidden rather than destroyed
 
         self.warning_bar = None # Warning bar
         
@@ -59,11 +58,34 @@ class MainWindowUI:
             self.action_window.hide()  # Hide initially
 
         self.current_docker_status_check_id = None  # ID for the current Docker status check
-        self.current_container_status_check_id = None  # ID for the current container status check
+        self.container_event_thread = None  # Background thread following Docker container events
+        self._stopped_container_event_thread = None  # Previous watch thread, told to stop but possibly still running
+        self.llm_dot = None  # Status dot for the LLM containers
+        self.whisper_dot = None  # Status dot for the Whisper containers
+        self._docker_widgets = []  # Widgets in the Docker status bar, enabled and disabled together
+        self.docker_executor = ThreadPoolExecutor(max_workers=2)  # Runs container start/stop requests off the Tk thread
+        self._pending_status_icons = {}  # Latest state per status dot, waiting to be drawn on the next idle
+        self._pending_status_icons_lock = threading.Lock()
         self.root.bind("<<ProcessDataTab>>", self.__create_data_menu)  # Bind the destroy event to clean up resources
 
         self.manage_app_data_menu = None  # Manage App Data menu
 
+        # Render the help documents in the background so opening them later is instant
+        threading.Thread(target=self._preload_md_content, daemon=True).start()
+
+    @property
+    def setting_window(self):
+        """
+        The settings window, created the first time it is needed.
+
+        SettingsWindowUI pulls in the model, Whisper and Markdown modules, so it is
+        imported here rather than at module load to keep startup fast.
+        """
+        if self._setting_window is None:
+            from UI.SettingsWindowUI import SettingsWindowUI
+            self._setting_window = SettingsWindowUI(self.app_settings, self, self.root)
+        return self._setting_window
+
     def load_main_window(self):
         """
         Load the main window of the application.
@@ -99,6 +121,9 @@ class MainWindowUI:
         if self.docker_status_bar is not None:
             return
 
+        # Pick up container names from settings loaded since the logic was created
+        self.logic.update_container_names()
+
         # Create the frame for the Docker status bar, placed at the bottom of the window
         self.docker_status_bar = tk.Frame(self.root, bd=1, relief=tk.SUNKEN)
         self.docker_status_bar.grid(row=4, column=0, columnspan=14, sticky='nsew')
@@ -126,24 +151,46 @@ class MainWindowUI:
         whisper_dot.pack(side=tk.LEFT)
 
         # Start button for Whisper container with a command to invoke the start method from logic
-        start_whisper_button = tk.Button(self.docker_status_bar, text="Start Whisper", command=lambda: self.logic.start_whisper_container(whisper_dot, self.app_settings))
+        start_whisper_button = tk.Button(self.docker_status_bar, text="Start Whisper", command=lambda: self.docker_executor.submit(self.logic.start_whisper_container, whisper_dot))
         start_whisper_button.pack(side=tk.RIGHT)
 
         # Start button for LLM container with a command to invoke the start method from logic
-        start_llm_button = tk.Button(self.docker_status_bar, text="Start LLM", command=lambda: self.logic.start_LLM_container(llm_dot, self.app_settings))
+        start_llm_button = tk.Button(self.docker_status_bar, text="Start LLM", command=lambda: self.docker_executor.submit(self.logic.start_LLM_container, llm_dot))
         start_llm_button.pack(side=tk.RIGHT)
 
         # Stop button for Whisper container with a command to invoke the stop method from logic
-        stop_whisper_button = tk.Button(self.docker_status_bar, text="Stop Whisper", command=lambda: self.logic.stop_whisper_container(whisper_dot, self.app_settings))
+        stop_whisper_button = tk.Button(self.docker_status_bar, text="Stop Whisper", command=lambda: self.docker_executor.submit(self.logic.stop_whisper_container, whisper_dot))
         stop_whisper_button.pack(side=tk.RIGHT)
 
         # Stop button for LLM container with a command to invoke the stop method from logic
-        stop_llm_button = tk.Button(self.docker_status_bar, text="Stop LLM", command=lambda: self.logic.stop_LLM_container(llm_dot, self.app_settings))
+        stop_llm_button = tk.Button(self.docker_status_bar, text="Stop LLM", command=lambda: self.docker_executor.submit(self.logic.stop_LLM_container, llm_dot))
         stop_llm_button.pack(side=tk.RIGHT)
 
+        self.llm_dot = llm_dot
+        self.whisper_dot = whisper_dot
+        self._docker_widgets = [
+            self.docker_status, llm_status, llm_dot, whisper_status, whisper_dot,
+            start_whisper_button, start_llm_button, stop_whisper_button, stop_llm_button
+        ]
         self.is_status_bar_enabled = True
         self._background_availbility_docker_check()
-        self._background_check_container_status(llm_dot, whisper_dot)
+
+    def refresh_docker_status_bar(self):
+        """
+        Update the existing Docker status bar in place after a settings change.
+
+        Re-reads the container names and re-checks both status dots without
+        destroying and recreating the bar's widgets.
+        """
+        if FeatureToggle.DOCKER_STATUS_BAR is not True:
+            return
+
+        if self.docker_status_bar is None:
+            return
+
+        self.logic.update_container_names()
+        self.docker_executor.submit(self._refresh_llm_status_icon)
+        self.docker_executor.submit(self._refresh_whisper_status_icon)
 
     def create_warning_bar(self, text, closeButton=True):
         """
@@ -202,9 +249,7 @@ class MainWindowUI:
         
         self.is_status_bar_enabled = False
         self.docker_status.config(text="(Docker not found)")
-        if self.docker_status_bar is not None:
-            for child in self.docker_status_bar.winfo_children():
-                child.configure(state='disabled')
+        self._set_docker_widgets_state('disabled')
 
     def enable_docker_ui(self):
         """
@@ -216,9 +261,18 @@ class MainWindowUI:
         
         self.is_status_bar_enabled = True
         self.docker_status.config(text="Docker Container Status: ")
-        if self.docker_status_bar is not None:
-            for child in self.docker_status_bar.winfo_children():
-                child.configure(state='normal')
+        self._set_docker_widgets_state('normal')
+
+    def _set_docker_widgets_state(self, state):
+        """
+        Set the state of every widget in the Docker status bar.
+
+        Uses the widget list recorded when the bar was built instead of querying Tk for the children.
+
+        :param state: The Tk widget state, 'normal' or 'disabled'.
+        """
+        for widget in self._docker_widgets:
+            widget.configure(state=state)
 
     def destroy_docker_status_bar(self):
         """
@@ -230,15 +284,20 @@ class MainWindowUI:
         if self.docker_status_bar is not None:
             self.docker_status_bar.destroy()
             self.docker_status_bar = None
+            self._docker_widgets = []
 
         # cancel the check loop as the bar no longer exists and it is waster resources.
         if self.current_docker_status_check_id is not None:
             self.root.after_cancel(self.current_docker_status_check_id)
             self.current_docker_status_check_id = None
         
-        if self.current_container_status_check_id is not None:
-            self.root.after_cancel(self.current_container_status_check_id)
-            self.current_container_status_check_id = None
+        self.logic.container_manager.stop_watching_events()
+        # Closing the stream does not end the thread at once; a new watch waits for it
+        if self.container_event_thread is not None:
+            self._stopped_container_event_thread = self.container_event_thread
+            self.container_event_thread = None
+        self.llm_dot = None
+        self.whisper_dot = None
 
     def toggle_menu_bar(self, enable: bool, is_recording: bool = False):
         """
@@ -281,7 +340,7 @@ class MainWindowUI:
         # Add Settings menu
         setting_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.menu_bar.add_cascade(label="Settings", menu=setting_menu)
-        setting_menu.add_command(label="Settings", command=self.setting_window.open_settings_window)
+        setting_menu.add_command(label="Settings", command=lambda: self.setting_window.open_settings_window())
 
     def _destroy_settings_menu(self):
         """
@@ -298,9 +357,19 @@ class MainWindowUI:
         help_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.menu_bar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="Help Guide", command=lambda: ImageWindow(self.root, "Help Guide", get_file_path('assets', 'help.png'), width=1000, height=686))
-        help_menu.add_command(label="Debug Window", command=lambda: DebugPrintWindow(self))
+        help_menu.add_command(label="Debug Window", command=self._show_debug_window)
         help_menu.add_command(label="About", command=lambda: self._show_md_content(get_file_path('markdown','help','about.md'), 'About'))
 
+    def _show_debug_window(self):
+        """
+        Show the debug output window, creating it the first time it is opened
+        or again if its window has been destroyed.
+        """
+        if self.debug_window is None or not self.debug_window.window.winfo_exists():
+            self.debug_window = DebugPrintWindow(self)
+        else:
+            self.debug_window.show()
+
     def _destroy_help_menu(self):
         """
         Private method to destroy the Help menu.
@@ -337,25 +406,32 @@ class MainWindowUI:
         This method shows a message box with information about the application when the About option is selected from the Help menu.
         """
 
+        # Imported here so markdown and tkhtmlview are only loaded once a document is shown
+        from UI.MarkdownWindow import MarkdownWindow
+
         # Callback function called when the window is closed
         def on_close(checkbox_state):
-            self.setting_window.settings.editable_settings['Show Welcome Message'] = not checkbox_state
-            self.setting_window.settings.save_settings_to_file()
+            self.app_settings.editable_settings['Show Welcome Message'] = not checkbox_state
+            self.app_settings.save_settings_to_file()
         
         # Create a MarkdownWindow to display the content
         MarkdownWindow(self.root, title, file_path, 
                   callback=on_close if show_checkbox else None)
             
 
-    def _on_help_window_close(self, help_window, dont_show_again: tk.BooleanVar):
+    def _preload_md_content(self):
         """
-        Private method to handle the closing of the help window.
-        Updates the 'Show Welcome Message' setting based on the checkbox state.
+        Private method to render the About and Welcome documents ahead of time.
+        Runs on a background thread and only fills the Markdown render cache; no widgets are touched.
         """
-        self.setting_window.settings.editable_settings['Show Welcome Message'] = not dont_show_again.get()
-        self.setting_window.settings.save_settings_to_file()
-        help_window.destroy()
-    
+        from UI.MarkdownWindow import render_markdown
+
+        for file_path in (get_file_path('markdown', 'welcome.md'), get_file_path('markdown', 'help', 'about.md')):
+            try:
+                render_markdown(file_path)
+            except Exception as e:
+                logger.debug(f"Could not preload {file_path}: {e}")
+
     def show_welcome_message(self):
         """
         Private method to display a welcome message.
@@ -377,6 +453,7 @@ class MainWindowUI:
             # Enable the Docker status bar UI elements if not enabled
             if not self.is_status_bar_enabled:
                 self.enable_docker_ui()
+            self._start_container_event_watch()
             logger.info("Docker client is available.")
         else:
             # Disable the Docker status bar UI elements if not disabled
@@ -387,17 +464,96 @@ class MainWindowUI:
 
         self.current_docker_status_check_id = self.root.after(DOCKER_DESKTOP_CHECK_INTERVAL, self._background_availbility_docker_check)
 
-    def _background_check_container_status(self, llm_dot, whisper_dot):
+    def _start_container_event_watch(self):
         """
-        Check the status of Docker containers in the background.
+        Start following Docker container events in a background thread.
 
-        This method is intended to be run in a separate thread to periodically
-        check the status of the LLM and Whisper containers.
+        The status dots are refreshed once and then only when Docker reports a
+        container starting or stopping, instead of polling every container.
+        Does nothing if the status bar does not exist or a watch is already running.
+
+        A watch stopped with the previous status bar may still be running. The new
+        thread shows the current states straight away, then waits for the old watch
+        to end before following events itself.
+        """
+        if self.llm_dot is None or self.whisper_dot is None:
+            return
+
+        if self.container_event_thread is not None and self.container_event_thread.is_alive():
+            return
+
+        previous_thread = self._stopped_container_event_thread
+        self._stopped_container_event_thread = None
+
+        def watch():
+            self._refresh_llm_status_icon()
+            self._refresh_whisper_status_icon()
+
+            if previous_thread is not None and previous_thread.is_alive():
+                # The old thread may have subscribed after the stream was closed, so keep closing it
+                while previous_thread.is_alive():
+                    self.logic.container_manager.stop_watching_events()
+                    previous_thread.join(0.1)
+                # States may have changed while the old watch was shutting down
+                self._refresh_llm_status_icon()
+                self._refresh_whisper_status_icon()
+
+            self.logic.container_manager.watch_events(self._on_container_event)
+
+        self.container_event_thread = threading.Thread(target=watch, daemon=True)
+        self.container_event_thread.start()
+
+    def _on_container_event(self, container_name, state):
+        """
+        Handle a container state change reported by the Docker event stream.
+
+        Runs on the event thread. Only the group the container belongs to is re-checked.
+
+        :param container_name: The name of the container that changed.
+        :param state: The new state of the container.
+        """
+        if container_name in self.logic.llm_container_names():
+            self._refresh_llm_status_icon()
+        elif container_name in self.logic.whisper_container_names():
+            self._refresh_whisper_status_icon()
+
+    def _refresh_llm_status_icon(self):
+        """
+        Check the LLM containers and schedule the LLM status dot update on the Tk thread.
+        """
+        self._schedule_status_icon(self.llm_dot, self.logic.check_llm_containers())
+
+    def _refresh_whisper_status_icon(self):
+        """
+        Check the Whisper containers and schedule the Whisper status dot update on the Tk thread.
+        """
+        self._schedule_status_icon(self.whisper_dot, self.logic.check_whisper_containers())
+
+    def _schedule_status_icon(self, dot, state):
+        """
+        Queue a status dot update and schedule one idle callback to draw the queue.
+
+        Starting or stopping a group produces an event per container, so a burst
+        of events only redraws each dot once, with its latest state.
+
+        :param dot: The status dot widget.
+        :param state: The container state to display.
+        """
+        with self._pending_status_icons_lock:
+            schedule = not self._pending_status_icons
+            self._pending_status_icons[dot] = state
+        if schedule:
+            self.root.after_idle(self._apply_pending_status_icons)
+
+    def _apply_pending_status_icons(self):
+        """
+        Set the queued status dot colors, ignoring dots destroyed since they were queued.
         """
-        if self.is_status_bar_enabled:
-            self.logic.container_manager.set_status_icon_color(llm_dot, self.logic.check_llm_containers())
-            self.logic.container_manager.set_status_icon_color(whisper_dot, self.logic.check_whisper_containers())
-            self.current_container_status_check_id = self.root.after(DOCKER_CONTAINER_CHECK_INTERVAL, self._background_check_container_status, llm_dot, whisper_dot)
+        with self._pending_status_icons_lock:
+            pending, self._pending_status_icons = self._pending_status_icons, {}
+        for dot, state in pending.items():
+            if dot is not None and dot.winfo_exists():
+                self.logic.container_manager.set_status_icon_color(dot, state)
     
     def __create_data_menu(self, event=None):
         logger.info("Creating Manage App Data menu")
@@ -1,4 +1,6 @@
 from tkinter import Toplevel, messagebox
+import functools
+import os
 import markdown as md
 import tkinter as tk
 from tkhtmlview import HTMLLabel
@@ -11,6 +13,44 @@ import re
 from UI.ImageWindow import ImageWindow
 
 
+def render_markdown(file_path):
+    """
+    Convert a Markdown file to HTML, reusing the result until the file changes.
+
+    :param file_path: The path to the Markdown file.
+    :return: The rendered HTML.
+    :raises FileNotFoundError: If the file does not exist.
+    :raises UnicodeDecodeError: If the file is neither UTF-8 nor cp1252.
+    """
+    return _render_markdown(file_path, os.path.getmtime(file_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _render_markdown(file_path, mtime):
+    """
+    Read and convert a Markdown file to HTML. ``mtime`` is only used as part of the cache key.
+    """
+    try:
+        with open(file_path, "r", encoding='utf-8') as file:
+            content = file.read()
+    except UnicodeDecodeError:
+        with open(file_path, "r", encoding='cp1252') as file:
+            content = file.read()
+    return md.markdown(_process_markdown_images(content), extensions=["extra", "smarty"])
+
+
+def _process_markdown_images(content):
+    """
+    Process markdown image tags to add size constraints.
+    """
+    image_pattern = r'!\[(.*?)\]\((.*?)\)'
+    def replace_with_html(match):
+        alt_text = match.group(1)
+        image_path = match.group(2)
+        return f'<img src="{image_path}" alt="{alt_text}" width="500" />'
+    return re.sub(image_pattern, replace_with_html, content)
+
+
 class MarkdownWindow:
     """
     A class to display a Markdown file in a pop-up window with optional callback functionality.
@@ -72,24 +112,15 @@ class MarkdownWindow:
     def _process_and_render_content(self):
         """Process the input file and convert it to HTML."""
         try:
-            with open(self.file_path, "r", encoding='utf-8') as file:
-                content = file.read()
-            content = self._process_markdown_images(content)
-            return md.markdown(content, extensions=["extra", "smarty"])
+            return render_markdown(self.file_path)
         except FileNotFoundError:
             logger.error(f"File not found: {self.file_path}")
             messagebox.showerror("Error", "File not found")
             return ""
-        except UnicodeDecodeError:
-            try:
-                with open(self.file_path, "r", encoding='cp1252') as file:
-                    content = file.read()
-                content = self._process_markdown_images(content)
-                return md.markdown(content, extensions=["extra", "smarty"])
-            except Exception as e:
-                logger.error(f"Error reading file: {e}")
-                messagebox.showerror("Error", "Error reading file")
-                return ""
+        except Exception as e:
+            logger.error(f"Error reading file: {e}")
+            messagebox.showerror("Error", "Error reading file")
+            return ""
 
     def _create_main_content(self, html_content):
         """Create the main content area with scrollable HTMLLabel."""
@@ -169,17 +200,6 @@ class MarkdownWindow:
         image_window.window.grab_set()              # Ensure ImageWindow gets focus
         image_window.window.focus_force()           # Force focus on ImageWindow
 
-    def _process_markdown_images(self, content):
-        """
-        Process markdown image tags to add size constraints.
-        """
-        image_pattern = r'!\[(.*?)\]\((.*?)\)'
-        def replace_with_html(match):
-            alt_text = match.group(1)
-            image_path = match.group(2)
-            return f'<img src="{image_path}" alt="{alt_text}" width="500" />'
-        return re.sub(image_pattern, replace_with_html, content)
-
     def _bind_mousewheel(self, event):
         """Bind mousewheel to HTMLLabel and temporarily unbind parent's mousewheel."""
         if self.parent_mousewheel_binding:
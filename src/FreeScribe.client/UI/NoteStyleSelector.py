@@ -211,11 +211,12 @@ class NoteStyleSelector(tk.Frame):
             StylePromptInfo: Object containing current style information.
         """
         current_style = NoteStyleSelector.current_style
-        if current_style in NoteStyleSelector.style_data:
+        prompts = NoteStyleSelector.style_data.get(current_style)
+        if prompts is not None:
             return StylePromptInfo(
                 style_name=current_style,
-                pre_prompt=NoteStyleSelector.style_data[current_style]['pre_prompt'],
-                post_prompt=NoteStyleSelector.style_data[current_style]['post_prompt']
+                pre_prompt=prompts['pre_prompt'],
+                post_prompt=prompts['post_prompt']
             )
         else:
             return StylePromptInfo(
@@ -249,7 +250,8 @@ class NoteStyleSelector(tk.Frame):
             elif len(NoteStyleSelector.style_options) > 1:
                 # Reset to current style
                 self.style_var.set(NoteStyleSelector.current_style)
-        else:
+        elif selected_value != NoteStyleSelector.current_style:
+            # Re-selecting the current style changes nothing, so skip rewriting the styles file
             NoteStyleSelector.current_style = selected_value
             NoteStyleSelector.save_styles()
 
@@ -57,17 +57,14 @@ class RecordingsManager:
         scrollbar.config(command=self.recordings_list.yview)
 
         # Populate recordings list
-        if os.path.exists(get_resource_path("recordings")):
-            recordings_dir = get_resource_path("recordings")
-            files_found = False
-            for f in sorted(os.listdir(recordings_dir)):
-                if f.endswith('.AE2'):
-                    self.recordings_list.insert('end', f)
-                    files_found = True
-            
-            if not files_found:
-                self.recordings_list.insert('end', "No recordings found")
-                self.recordings_list.itemconfig(0, {'fg': 'gray'})
+        recordings_dir = get_resource_path("recordings")
+        recordings = []
+        if os.path.exists(recordings_dir):
+            recordings = sorted(f for f in os.listdir(recordings_dir) if f.endswith('.AE2'))
+
+        if recordings:
+            # One insert call for the whole list instead of one per file
+            self.recordings_list.insert('end', *recordings)
         else:
             self.recordings_list.insert('end', "No recordings found")
             self.recordings_list.itemconfig(0, {'fg': 'gray'})
@@ -89,7 +86,8 @@ class RecordingsManager:
         )
         self.position_scale.pack(side='left', expand=True, fill='x', padx=5)
 
-        self.time_label = Label(controls_frame, text="00:00 / 00:00")
+        self.time_var = tk.StringVar(value="00:00 / 00:00")
+        self.time_label = Label(controls_frame, textvariable=self.time_var)
         self.time_label.pack(side='left', padx=5)
 
         # Action buttons
@@ -167,6 +165,7 @@ class RecordingsManager:
 
     def play_audio(self):
         """Audio playback thread"""
+        stream = self.stream
         try:
             self.wf.setpos(int(self.current_position * self.wf.getframerate()))
             chunk_size = 1024
@@ -189,8 +188,14 @@ class RecordingsManager:
 
         except Exception as e:
             logger.exception("Playback error")
-            messagebox.showerror("Playback Error", f"Error during playback: {str(e)}")
+            self.parent.after(0, messagebox.showerror, "Playback Error", f"Error during playback: {str(e)}")
         finally:
+            # Tk is not thread-safe, so clean up on the Tk thread
+            self.parent.after(0, self._on_playback_finished, stream)
+
+    def _on_playback_finished(self, stream):
+        """Stop playback once the audio thread ends, unless a newer recording is already playing"""
+        if self.stream is stream:
             self.stop_playback()
 
     def toggle_playback(self):
@@ -215,7 +220,8 @@ class RecordingsManager:
         if self.wf_buffer:
             self.wf_buffer.close()
             self.wf_buffer = None
-        self.play_button.config(text="▶️")
+        if self.popup.winfo_exists():
+            self.play_button.config(text="▶️")
 
     def seek_position(self, pos):
         """Seek to specific position in recording"""
@@ -285,7 +291,10 @@ class RecordingsManager:
         """Update time display label"""
         current_time = self.position_var.get()
         duration = self.duration_var.get()
-        self.time_label.config(text=f"{self.format_time(current_time)} / {self.format_time(duration)}")
+        time_text = f"{self.format_time(current_time)} / {self.format_time(duration)}"
+        # The label only changes once a second, so skip the Tk update on most ticks
+        if time_text != self.time_var.get():
+            self.time_var.set(time_text)
         self.popup.after(200, self.update_time_label)
 
     def format_time(self, seconds):
@@ -296,30 +305,35 @@ class RecordingsManager:
 
     def generate_note(self):
         """Generate a note from the selected recording"""
-        def note_loading():
-            
-            selection = self.recordings_list.curselection()
-            if not selection:
+        selection = self.recordings_list.curselection()
+        if not selection:
+            return
+
+        # Note: The path is gotten in decrypt_whole_audio_file method
+        filename = self.recordings_list.get(selection[0])
+        encrypted_path = filename
+
+        def on_done(wav_data=None, error=None):
+            if error:
+                messagebox.showerror("Error", f"Could not generate note: {str(error)}")
                 return
-            
-            # Note: The path is gotten in decrypt_whole_audio_file method
-            filename = self.recordings_list.get(selection[0])
-            encrypted_path = filename
 
-            try:
-                # Decrypt and get transcription
-                wav_data = utils.audio.decrypt_whole_audio_file(encrypted_path)
+            RecordingsManager.last_selected_data = wav_data
+            self.parent.event_generate("<<GenerateNote>>")
 
-                RecordingsManager.last_selected_data = wav_data
-                self.parent.event_generate("<<GenerateNote>>")
-                
+            if self.popup.winfo_exists():
                 self.popup.destroy()
-                
+
+        def note_loading():
+            try:
+                # Decrypt off the Tk thread so the window stays responsive for long recordings
+                wav_data = utils.audio.decrypt_whole_audio_file(encrypted_path)
+                self.parent.after(0, lambda: on_done(wav_data=wav_data))
             except Exception as e:
-                logger.exception("Error generating note")
-                messagebox.showerror("Error", f"Could not generate note: {str(e)}")
+                logger.exception("Error decrypting recording")
+                self.parent.after(0, lambda error=e: on_done(error=error))
 
-        self.parent.after(0, note_loading)
+        threading.Thread(target=note_loading, daemon=True).start()
 
 
     def on_close(self):
@@ -70,6 +70,7 @@ class SettingsWindow():
     DEFAULT_WHISPER_ARCHITECTURE = Architectures.CPU.architecture_value
     DEFAULT_LLM_ARCHITECTURE = Architectures.CPU.architecture_value
     AUTO_DETECT_LANGUAGE_CODES = ["", " ","auto", "Auto Detect", "None", "None (Auto Detect)"]
+    _available_architectures = None  # Resolved from the install state files on first use
 
     DEFAULT_SETTINGS_TABLE = {
             SettingsKeys.LOCAL_LLM_MODEL.value: "gemma2:2b-instruct-q8_0",
@@ -687,16 +688,22 @@ class SettingsWindow():
 
         Files must be named CPU_INSTALL or NVIDIA_INSTALL
 
+        The install state does not change while the application runs, so the
+        files are only checked on the first call.
+
         Returns:
-            list: A list of available architectures for the user to choose from.
+            tuple: The available architectures for the user to choose from.
         """
-        architectures = [Architectures.CPU.label]  # CPU is always available as fallback
+        if SettingsWindow._available_architectures is None:
+            architectures = [Architectures.CPU.label]  # CPU is always available as fallback
+
+            # Check for NVIDIA support
+            if os.path.isfile(get_file_path(self.STATE_FILES_DIR, self.NVIDIA_INSTALL_FILE)):
+                architectures.append(Architectures.CUDA.label)
 
-        # Check for NVIDIA support
-        if os.path.isfile(get_file_path(self.STATE_FILES_DIR, self.NVIDIA_INSTALL_FILE)):
-            architectures.append(Architectures.CUDA.label)
+            SettingsWindow._available_architectures = tuple(architectures)
 
-        return architectures
+        return SettingsWindow._available_architectures
 
     def update_whisper_model(self):
         # save the old whisper model to compare with the new model later
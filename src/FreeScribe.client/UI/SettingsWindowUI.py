@@ -896,6 +896,8 @@ pady=5, sticky="w")
 
         if self.settings.editable_settings["Use Docker Status Bar"] and self.main_window.docker_status_bar is None:
             self.main_window.create_docker_status_bar()
+        elif self.settings.editable_settings["Use Docker Status Bar"]:
+            self.main_window.refresh_docker_status_bar()
         elif not self.settings.editable_settings["Use Docker Status Bar"] and self.main_window.docker_status_bar is not None:
             self.main_window.destroy_docker_status_bar()
 
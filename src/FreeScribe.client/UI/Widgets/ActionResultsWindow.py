@@ -6,13 +6,63 @@ import tkinter as tk
 from tkinter import ttk
 from PIL import Image, ImageTk
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import webbrowser
 import os
+import re
+import subprocess
+import sys
 from typing import Dict, Any, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+MAP_THUMBNAIL_SIZE = (350, 350)  # Size map images are shown at on a card
+PARENT_MOVE_DEBOUNCE_MS = 50  # Quiet time after the last parent <Configure> before the window follows
+
+# Tk geometry string "WxH+X+Y"; offsets can be negative and are then written as "+-X"
+_GEOMETRY_RE = re.compile(r"(\d+)x(\d+)\+?(-?\d+)\+?(-?\d+)")
+
+# Decoding and resampling run here so adding a card never waits on image work
+_THUMBNAIL_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="map-thumbnail")
+
+if sys.platform == "win32":
+    _open_with_default_app = os.startfile
+else:
+    # Command that opens a file with its default application, resolved once for the platform
+    _FILE_OPENER = "open" if sys.platform == "darwin" else "xdg-open"
+
+    def _open_with_default_app(file_path: str) -> None:
+        """
+        Open a file with the default application without waiting for it.
+        
+        :param file_path: Path to the file to open
+        """
+        try:
+            # Popen without a shell: no waiting on the opener and no quoting of the path
+            subprocess.Popen([_FILE_OPENER, file_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            webbrowser.open(file_path)  # Fallback
+
+
+@functools.lru_cache(maxsize=16)
+def _load_map_thumbnail(path: str, mtime: float, size: tuple) -> Image.Image:
+    """
+    Open a map image and resize it for display on a card.
+    
+    Cached by path and modification time, so a map shown again is not decoded twice.
+    
+    :param path: Path to the map image
+    :param mtime: Modification time of the file, part of the cache key
+    :param size: Size to resize the image to
+    :return: The resized image
+    """
+    image = Image.open(path)
+    # For JPEGs this lets the decoder downscale by up to 8x before resampling; other formats ignore it
+    image.draft("RGB", size)
+    return image.resize(size, Image.Resampling.LANCZOS)
+
 class ActionResultsWindow:
     """
     Window for displaying intent action results.
@@ -31,11 +81,14 @@ class ActionResultsWindow:
         self.window = None
         self.canvas = None
         self.scrollable_frame = None
-        self.images = []  # Store image references to prevent garbage collection
+        self.images = {}  # PhotoImage per (map path, modification time), shared by cards and kept from garbage collection
+        self._image_users = {}  # Number of map labels showing each image; the image is dropped when it reaches zero
         
         # Track window state
         self.is_visible = False
         self.last_parent_geometry = None
+        self._move_after_id = None  # Pending follow-the-parent update, rescheduled on every <Configure>
+        self._scroll_region_after_id = None  # Pending scroll region update, at most one per idle period
         self.min_width = 400
         self.min_height = 300
         
@@ -51,6 +104,8 @@ class ActionResultsWindow:
                 self.window.destroy()
             except tk.TclError:
                 pass
+        # An update pending for the old canvas may never run; do not let it block the new one
+        self._scroll_region_after_id = None
                 
         self.window = tk.Toplevel(self.parent)
         self.window.title("Action Results")
@@ -90,22 +145,22 @@ class ActionResultsWindow:
         
         # Create scrollable frame
         self.canvas = tk.Canvas(content_frame)
-        scrollbar = ttk.Scrollbar(content_frame, orient="vertical", command=self.canvas.yview)
+        self.scrollbar = ttk.Scrollbar(content_frame, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas)
         
-        # Configure scrolling
+        # Configure scrolling; a burst of <Configure> events while cards are laid out shares one update
         self.scrollable_frame.bind(
             "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            lambda e: self._schedule_scroll_region_update()
         )
         
         # Create the window in the canvas
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
         
         # Pack canvas and scrollbar
         self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.scrollbar.pack(side="right", fill="y")
         
         # Add Clear All button at the bottom
         bottom_frame = ttk.Frame(main_container)
@@ -142,57 +197,68 @@ class ActionResultsWindow:
             self.canvas.configure(width=event.width - 20)  # Account for scrollbar and padding
             
     def _bind_mouse_wheel_events(self) -> None:
-        """Bind mouse wheel events to the canvas."""
-        def _bind_to_mousewheel(event):
-            if event.widget == self.canvas:
-                return
-            self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-            self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-            self.canvas.bind_all("<Button-5>", self._on_mousewheel)
-            
-        def _unbind_from_mousewheel(event):
-            if event.widget == self.canvas:
-                return
-            self.canvas.unbind_all("<MouseWheel>")
-            self.canvas.unbind_all("<Button-4>")
-            self.canvas.unbind_all("<Button-5>")
-        
-        # Bind mouse wheel to canvas permanently
-        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind("<Button-4>", self._on_mousewheel)
-        self.canvas.bind("<Button-5>", self._on_mousewheel)
-        
-        # Bind enter/leave events to scrollable frame
-        self.scrollable_frame.bind("<Enter>", _bind_to_mousewheel)
-        self.scrollable_frame.bind("<Leave>", _unbind_from_mousewheel)
+        """
+        Bind mouse wheel events to the canvas.
+        
+        The bindings are Tcl scripts rather than Python callbacks, so each
+        wheel tick scrolls the canvas without a round-trip through Python.
+        They are made once on the results window itself: its bindtag is on
+        every widget inside it, so wheel events over any card reach the canvas
+        without rebinding anything app-wide as the pointer moves. Events over
+        the scrollbar are skipped, since its own class binding already scrolls.
+        """
+        wheel_scripts = {
+            # Windows and macOS report the direction in the delta
+            "<MouseWheel>": f"if {{%D > 0}} {{{self.canvas} yview scroll -1 units}} elseif {{%D < 0}} {{{self.canvas} yview scroll 1 units}}",
+            # X11 reports the wheel as buttons 4 and 5
+            "<Button-4>": f"{self.canvas} yview scroll -1 units",
+            "<Button-5>": f"{self.canvas} yview scroll 1 units",
+        }
+        for sequence, script in wheel_scripts.items():
+            self.window.bind(sequence, f"if {{\"%W\" ne \"{self.scrollbar}\"}} {{{script}}}")
+        
+    def _update_window_position(self, parent_geometry: str = None) -> None:
+        """
+        Update the window position to stay on the right side of parent.
         
-    def _update_window_position(self) -> None:
-        """Update the window position to stay on the right side of parent."""
+        :param parent_geometry: The parent's geometry string, if the caller already has it
+        """
         if not self.window or not self.is_visible:
             return
             
         try:
-            # Get parent window position and size
-            parent_x = self.parent.winfo_x()
-            parent_y = self.parent.winfo_y()
-            parent_width = self.parent.winfo_width()
+            # Get parent window position and size from one geometry query instead of one per value
+            parent_width, _, parent_x, parent_y = map(
+                int, _GEOMETRY_RE.fullmatch(parent_geometry or self.parent.geometry()).groups()
+            )
             
             # Calculate position for results window - add 15px gap
             window_x = parent_x + parent_width + 15
             window_y = parent_y
             
-            # Get current window size
-            window_width = self.window.winfo_width()
-            window_height = self.window.winfo_height()
-            
-            # Set window position while preserving size
-            self.window.geometry(f"{window_width}x{window_height}+{window_x}+{window_y}")
+            # Set window position; a position-only geometry preserves the current size
+            self.window.geometry(f"+{window_x}+{window_y}")
             
         except (tk.TclError, AttributeError) as e:
             logger.error(f"Error updating window position: {e}")
             
     def _on_parent_moved(self, event: tk.Event) -> None:
-        """Handle parent window movement/resize."""
+        """
+        Handle parent window movement/resize.
+        
+        Dragging fires <Configure> many times a second, so the update is
+        debounced and only runs once the parent has settled.
+        """
+        if not self.window or not self.is_visible:
+            return
+
+        if self._move_after_id is not None:
+            self.parent.after_cancel(self._move_after_id)
+        self._move_after_id = self.parent.after(PARENT_MOVE_DEBOUNCE_MS, self._follow_parent)
+
+    def _follow_parent(self) -> None:
+        """Move the window next to the parent if the parent geometry changed."""
+        self._move_after_id = None
         if not self.window or not self.is_visible:
             return
             
@@ -202,32 +268,30 @@ class ActionResultsWindow:
         # Only update if the geometry actually changed
         if current_geometry != self.last_parent_geometry:
             self.last_parent_geometry = current_geometry
-            self._update_window_position()
+            self._update_window_position(current_geometry)
             
     def _open_file(self, file_path: str) -> None:
         """Open a file with the default application."""
-        try:
-            os.startfile(file_path)
-        except AttributeError:  # os.startfile is Windows only
-            try:
-                import subprocess
-                subprocess.run(['xdg-open', file_path])  # Linux
-            except:
-                webbrowser.open(file_path)  # Fallback
+        _open_with_default_app(file_path)
         
     def add_result(self, result: Dict[str, Any]) -> None:
         """
         Add a new action result card to the window.
         
+        :param result: Action result data
+        """
+        self._build_card(result)
+        self._scroll_to_bottom()
+
+    def _build_card(self, result: Dict[str, Any]) -> None:
+        """
+        Create the widgets for one action result card without updating the layout.
+        
         :param result: Action result data
         """
         # Create card frame
         card = ttk.Frame(self.scrollable_frame, style="Card.TFrame")
-        card.pack(fill="x", padx=10, pady=5)
-        
-        # Bind mouse wheel events to the card and its children
-        card.bind("<Enter>", lambda e: self.scrollable_frame.event_generate("<Enter>"))
-        card.bind("<Leave>", lambda e: self.scrollable_frame.event_generate("<Leave>"))
+        card.pack(fill="x", padx=10, pady=(5, 10))
         
         # Add header with delete button
         header = ttk.Frame(card)
@@ -277,51 +341,35 @@ class ActionResultsWindow:
             
             # If there's a map image, show it below the link
             if "additional_info" in result["data"] and "map_image_path" in result["data"]["additional_info"]:
-                try:
-                    image = Image.open(result["data"]["additional_info"]["map_image_path"])
-                    image = image.resize((350, 350), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
-                    self.images.append(photo)  # Prevent garbage collection
-                    
-                    map_label = ttk.Label(card, image=photo)
-                    map_label.pack(pady=5)
-                except Exception as e:
-                    print(f"Error loading map image: {e}")
+                map_label = ttk.Label(card)
+                map_label.pack(pady=5)
+                self._show_map_image(map_label, result["data"]["additional_info"]["map_image_path"])
                     
         elif "additional_info" in result["data"]:
             info = result["data"]["additional_info"]
             
             # Handle map image if available
             if "map_image_path" in info:
-                try:
-                    image = Image.open(info["map_image_path"])
-                    image = image.resize((350, 350), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
-                    self.images.append(photo)  # Prevent garbage collection
-                    
-                    # Create frame for map and controls
-                    map_frame = ttk.Frame(card)
-                    map_frame.pack(pady=5)
-                    
-                    # Add map image
-                    map_label = ttk.Label(
-                        map_frame,
-                        image=photo,
-                        cursor="hand2"  # Always show hand cursor for clickable items
-                    )
-                    map_label.pack(pady=5)
-                    
-                    # Add click handler for map type
-                    map_label.bind("<Button-1>", lambda e: self._open_file(info["map_image_path"]))
-                    instruction = ttk.Label(
-                        map_frame,
-                        text="Click image to open for viewing/printing",
-                        foreground="gray"
-                    )
-                    instruction.pack(pady=2)
+                # Create frame for map and controls
+                map_frame = ttk.Frame(card)
+                map_frame.pack(pady=5)
                 
-                except Exception as e:
-                    print(f"Error loading map image: {e}")
+                # Add map image
+                map_label = ttk.Label(
+                    map_frame,
+                    cursor="hand2"  # Always show hand cursor for clickable items
+                )
+                map_label.pack(pady=5)
+                self._show_map_image(map_label, info["map_image_path"])
+                
+                # Add click handler for map type
+                map_label.bind("<Button-1>", lambda e: self._open_file(info["map_image_path"]))
+                instruction = ttk.Label(
+                    map_frame,
+                    text="Click image to open for viewing/printing",
+                    foreground="gray"
+                )
+                instruction.pack(pady=2)
             
             # Add other info
             if "floor" in info:
@@ -332,37 +380,122 @@ class ActionResultsWindow:
                 wing = ttk.Label(card, text=info["wing"])
                 wing.pack(pady=2)
                 
+            # Each bullet list is a single multi-line label rather than a label per item
             if "key_landmarks" in info:
                 landmarks = ttk.Label(card, text="Key Landmarks:")
                 landmarks.pack(pady=2)
-                for landmark in info["key_landmarks"]:
-                    lm = ttk.Label(card, text=f"• {landmark}")
-                    lm.pack(pady=1)
+                landmark_list = ttk.Label(
+                    card,
+                    text="\n".join(f"• {landmark}" for landmark in info["key_landmarks"]),
+                    justify="center"
+                )
+                landmark_list.pack(pady=1)
                     
             # Add directions info if available
             if "steps" in info:
                 steps = ttk.Label(card, text="Directions:")
                 steps.pack(pady=2)
-                for step in info["steps"]:
-                    s = ttk.Label(card, text=f"• {step}", wraplength=330)
-                    s.pack(pady=1)
+                step_list = ttk.Label(
+                    card,
+                    text="\n".join(f"• {step}" for step in info["steps"]),
+                    wraplength=330,
+                    justify="center"
+                )
+                step_list.pack(pady=1)
                     
-        # Add separator
-        ttk.Separator(self.scrollable_frame).pack(fill="x", padx=10, pady=10)
+        # Add separator inside the card, so it goes with the card and the scrollable frame only packs cards
+        ttk.Separator(card).pack(fill="x", pady=(10, 0))
+
+    def _show_map_image(self, label: ttk.Label, path: str) -> None:
+        """
+        Load a map thumbnail in the background and show it in a label once ready.
+        
+        :param label: The label to show the image in
+        :param path: Path to the map image
+        """
+        try:
+            key = (path, os.path.getmtime(path))
+        except OSError as e:
+            logger.error(f"Error loading map image: {e}")
+            return
+
+        # The same map on another card reuses the PhotoImage already in Tk
+        photo = self.images.get(key)
+        if photo is not None:
+            self._attach_map_image(label, key, photo)
+            return
+
+        def load():
+            try:
+                image = _load_map_thumbnail(*key, MAP_THUMBNAIL_SIZE)
+            except Exception as e:
+                logger.error(f"Error loading map image: {e}")
+                return
+            # PhotoImage must be created on the Tk thread
+            self.parent.after(0, self._apply_map_image, label, key, image)
+
+        _THUMBNAIL_EXECUTOR.submit(load)
+
+    def _apply_map_image(self, label: ttk.Label, key: tuple, image: Image.Image) -> None:
+        """
+        Show a loaded map thumbnail, unless its card was deleted in the meantime.
         
-        # Update the scroll region and scroll to the bottom
+        :param label: The label to show the image in
+        :param key: The (path, modification time) the image was loaded for
+        :param image: The resized map image
+        """
+        if not label.winfo_exists():
+            return
+        photo = self.images.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(image)
+            self.images[key] = photo
+        self._attach_map_image(label, key, photo)
+
+    def _attach_map_image(self, label: ttk.Label, key: tuple, photo: ImageTk.PhotoImage) -> None:
+        """
+        Show a map image in a label and hold the image for as long as the label exists.
+        
+        :param label: The label to show the image in
+        :param key: The (path, modification time) of the image
+        :param photo: The image to show
+        """
+        label.configure(image=photo)
+        self._image_users[key] = self._image_users.get(key, 0) + 1
+        label.bind("<Destroy>", lambda e: self._release_map_image(key), add="+")
+
+    def _release_map_image(self, key: tuple) -> None:
+        """
+        Drop a label's hold on a map image, freeing the image once no label shows it.
+        
+        :param key: The (path, modification time) of the image
+        """
+        users = self._image_users.get(key, 0) - 1
+        if users > 0:
+            self._image_users[key] = users
+        else:
+            self._image_users.pop(key, None)
+            self.images.pop(key, None)
+
+    def _scroll_to_bottom(self) -> None:
+        """Update the scroll region and scroll to the bottom."""
         self.scrollable_frame.update_idletasks()
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self.canvas.yview_moveto(1.0)  # Scroll to bottom
+        self.canvas.yview_moveto(1.0)
         
     def add_results(self, results: List[Dict[str, Any]]) -> None:
         """
         Add multiple action results to the window.
         
+        All cards are built first and the layout is updated once at the end,
+        instead of once per card.
+        
         :param results: List of action results
         """
         for result in results:
-            self.add_result(result)
+            self._build_card(result)
+        if results:
+            self._scroll_to_bottom()
             
     def _delete_card(self, card: ttk.Frame) -> None:
         """
@@ -371,24 +504,11 @@ class ActionResultsWindow:
         :param card: The card frame to delete
         """
         try:
-            # Get all children of scrollable_frame
-            children = self.scrollable_frame.winfo_children()
-            # Find the index of current card
-            card_index = children.index(card)
-            
-            # If there's a next widget and it's a separator, delete it
-            if card_index + 1 < len(children) and isinstance(children[card_index + 1], ttk.Separator):
-                children[card_index + 1].destroy()
-            # If it's not the first card and the previous widget is a separator, delete the previous separator
-            elif card_index > 0 and isinstance(children[card_index - 1], ttk.Separator):
-                children[card_index - 1].destroy()
-                
-            # Destroy the card
+            # Destroy the card, along with its separator
             card.destroy()
             
             # Update the scroll region
-            self.scrollable_frame.update_idletasks()
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            self._schedule_scroll_region_update()
             
         except Exception as e:
             logger.error(f"Error deleting card: {str(e)}")
@@ -404,10 +524,26 @@ class ActionResultsWindow:
             for widget in self.scrollable_frame.winfo_children():
                 widget.destroy()
         self.images.clear()
+        self._image_users.clear()
         
         # Update the scroll region
-        self.scrollable_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._schedule_scroll_region_update()
+
+    def _schedule_scroll_region_update(self) -> None:
+        """
+        Recompute the scroll region once the pending layout work has run.
+        
+        Replaces forcing update_idletasks; repeated requests before the idle
+        callback runs share a single update.
+        """
+        if self._scroll_region_after_id is None:
+            self._scroll_region_after_id = self.canvas.after_idle(self._update_scroll_region)
+
+    def _update_scroll_region(self) -> None:
+        """Set the scroll region to cover every card."""
+        self._scroll_region_after_id = None
+        if self.canvas.winfo_exists():
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         
     def show(self) -> None:
         """Show the window."""
@@ -431,11 +567,4 @@ class ActionResultsWindow:
                 self.is_visible = False
                 self.window.withdraw()
             except tk.TclError:
-                pass 
-
-    def _on_mousewheel(self, event: tk.Event) -> None:
-        """Handle mouse wheel scrolling."""
-        if event.num == 4 or event.delta > 0:  # Scroll up
-            self.canvas.yview_scroll(-1, "units")
-        elif event.num == 5 or event.delta < 0:  # Scroll down
-            self.canvas.yview_scroll(1, "units") 
\ No newline at end of file
+                pass
@@ -4,7 +4,6 @@ import pyaudio
 import numpy as np
 from PIL import Image, ImageTk
 from utils.file_utils import get_file_path
-from UI.SettingsWindowUI import SettingsWindowUI
 from utils.log_config import logger
 
 class MicrophoneState:
@@ -12,6 +11,8 @@ class MicrophoneState:
     SELECTED_MICROPHONE_NAME = None
 
 class MicrophoneTestFrame:
+    _styles_configured = False  # ttk styles are global to the interpreter, so they only need configuring once
+
     def __init__(self, parent, p, app_settings, root):
         """
         Initialize the MicrophoneTestFrame.
@@ -40,8 +41,6 @@ class MicrophoneTestFrame:
             'inactive': '#95a5a6'
         }
 
-        self.setting_window = SettingsWindowUI(self.app_settings, self, self.root)  # Settings window
-
         # Create a frame for the microphone test
         self.frame = ttk.Frame(self.parent)
         self.frame.grid(row=1, column=0, sticky='nsew')
@@ -105,10 +104,12 @@ class MicrophoneTestFrame:
         center_frame.grid_rowconfigure(0, weight=1)
         center_frame.grid_columnconfigure(0, weight=1)
 
-        # Create styles for all elements
-        style = ttk.Style()
-        style.configure('Disabled.TFrame', background='lightgray')  # Gray background for disabled state 
-        style.configure('Mic.TCombobox', padding=(5, 5, 5, 5))
+        # Create styles for all elements; reconfiguring them re-resolves every widget using the style
+        if not MicrophoneTestFrame._styles_configured:
+            style = ttk.Style()
+            style.configure('Disabled.TFrame', background='lightgray')  # Gray background for disabled state 
+            style.configure('Mic.TCombobox', padding=(5, 5, 5, 5))
+            MicrophoneTestFrame._styles_configured = True
 
         # Dropdown for microphone selection
         mic_options = [f"{name}" for _, name in self.mic_list]
@@ -180,7 +181,7 @@ class MicrophoneTestFrame:
             selected_index = self.mic_mapping[selected_name]
             self.update_selected_microphone(selected_index)
             # save the settings to the file
-            self.setting_window.settings.save_settings_to_file()
+            self.app_settings.save_settings_to_file()
             # Reopen the stream with the new device
             self.reopen_stream()  
 
@@ -96,54 +96,48 @@ class TimestampListbox(tk.Listbox):
         """Confirm and save the edited timestamp.
 
         Updates both the Listbox entry and the corresponding response history.
-
-        :raises tk.TclError: If there are widget-related issues
-        :raises ValueError: If the timestamp format is invalid
-        :raises Exception: For any other unexpected errors (logged and re-raised)
         """
-        try:
-            if self.edit_entry and self.edit_index is not None:
-                new_text = self.edit_entry.get()
-                self.delete(self.edit_index)
-                self.insert(self.edit_index, new_text)
-
-                # Update the corresponding response history
-                if self.edit_index < len(self.response_history):
-                    timestamp, user_message, response = self.response_history[self.edit_index]
-                    self.response_history[self.edit_index] = (new_text, user_message, response)
-
-                self.edit_entry.destroy()
-                self.edit_entry = None
-                self.edit_index = None
-        except tk.TclError as e:
-            # Handle Tkinter-specific errors (e.g., widget-related issues)
-            logger.exception(f"Failed to update timestamp: {str(e)}")
-            messagebox.showerror("UI Error", f"Failed to update timestamp: {str(e)}")
-        except ValueError as e:
-            # Handle validation errors
-            logger.exception(f"Invalid timestamp format: {str(e)}")
-            messagebox.showwarning("Invalid Input", f"Invalid timestamp format: {str(e)}")
-        except Exception as e:
-            # Log unexpected errors and re-raise them
-            logger.exception(f"Critical error while confirming timestamp edit: {str(e)}")
-            raise  # Re-raise unexpected exceptions to prevent silent failures
+        self._finalize_edit(save=True)
 
     def cancel_edit(self):
         """Cancel the editing operation.
 
         Destroys the edit Entry widget and resets editing state.
+        """
+        self._finalize_edit(save=False)
 
-        :raises tk.TclError: If there are widget-related issues
-        :raises ValueError: If the timestamp format is invalid
-        :raises Exception: For any other unexpected errors (logged and re-raised)
+    def _finalize_edit(self, save):
+        """End the current edit, optionally saving the new timestamp.
+
+        The editing state is cleared before the Entry is destroyed, so the
+        <FocusOut> fired by destroying it does not finish the edit a second time.
+        The Entry is destroyed even if saving fails.
+
+        :param save: Whether to write the edited text to the Listbox and response history
+        :type save: bool
+        :raises Exception: For any unexpected errors (logged and re-raised)
         """
+        edit_entry, edit_index = self.edit_entry, self.edit_index
+        if not edit_entry or edit_index is None:
+            return
+
+        self.edit_entry = None
+        self.edit_index = None
         try:
-            if self.edit_entry and self.edit_index is not None:
-                self.edit_entry.destroy()
-                self.edit_entry = None
-                self.edit_index = None
+            if save:
+                new_text = edit_entry.get()
+                # Focus-out confirms too, so most edits leave the text unchanged
+                if new_text != self.get(edit_index):
+                    self.delete(edit_index)
+                    self.insert(edit_index, new_text)
+
+                # Update the corresponding response history
+                if edit_index < len(self.response_history):
+                    timestamp, user_message, response = self.response_history[edit_index]
+                    self.response_history[edit_index] = (new_text, user_message, response)
         except tk.TclError as e:
             # Handle Tkinter-specific errors (e.g., widget-related issues)
+            logger.exception(f"Failed to update timestamp: {str(e)}")
             messagebox.showerror("UI Error", f"Failed to update timestamp: {str(e)}")
         except ValueError as e:
             # Handle validation errors
@@ -151,5 +145,7 @@ class TimestampListbox(tk.Listbox):
             messagebox.showwarning("Invalid Input", f"Invalid timestamp format: {str(e)}")
         except Exception as e:
             # Log unexpected errors and re-raise them
-            logger.exception(f"Critical error while confirming timestamp edit: {str(e)}")
+            logger.exception(f"Critical error while finishing timestamp edit: {str(e)}")
             raise  # Re-raise unexpected exceptions to prevent silent failures
+        finally:
+            edit_entry.destroy()
@@ -66,6 +66,7 @@ from UI.ScrubWindow import ScrubWindow
 from utils.log_config import logger
 from Model import ModelStatus
 from services.whisper_hallucination_cleaner import hallucination_cleaner
+from utils.model_events import model_load_finished
 from utils.whisper.WhisperModel import load_stt_model, faster_whisper_transcribe, is_whisper_valid, is_whisper_lock, load_model_with_loading_screen, unload_stt_model, get_model_from_settings, WhisperModelStatus, get_whisper_model, set_whisper_model
 from services.factual_consistency import find_factual_inconsistency
 import utils.arg_parser
@@ -201,8 +202,10 @@ def populate_ui_with_notes():
         IS_FIRST_LOG = False
         
         timestamp_listbox.delete(0, tk.END)
-        for time, user_msg, response in response_history:
-            timestamp_listbox.insert(tk.END, time)
+        # One insert call for all entries instead of one Tcl round-trip per note
+        timestamps = [time for time, _, _ in response_history]
+        if timestamps:
+            timestamp_listbox.insert(tk.END, *timestamps)
 
     root.after(0, action)
 
@@ -263,8 +266,7 @@ def safe_set_transcription_box(text, callback=None):
     def update_text():
         if user_input.scrolled_text.winfo_exists():
             user_input.scrolled_text.configure(state='normal')
-            user_input.scrolled_text.delete("1.0", tk.END)
-            user_input.scrolled_text.insert(tk.END, text)
+            user_input.scrolled_text.replace("1.0", tk.END, text)
             if callback:
                 callback()
         else:
@@ -281,8 +283,7 @@ def safe_set_note_box(text):
     def update_text():
         if response_display.scrolled_text.winfo_exists():
             response_display.scrolled_text.configure(state='normal')
-            response_display.scrolled_text.delete("1.0", tk.END)
-            response_display.scrolled_text.insert(tk.END, text)
+            response_display.scrolled_text.replace("1.0", tk.END, text)
         else:
             logger.warning("Note box does not exist, cannot set text.")
     root.after(0, update_text)
@@ -591,6 +592,15 @@ def record_audio():
         minimum_silent_duration = float(app_settings.editable_settings["Real Time Silence Length"])
         minimum_audio_duration = float(app_settings.editable_settings["Real Time Audio Length"])
 
+        # convert the setting from str to float
+        try:
+            speech_prob_threshold = float(
+                app_settings.editable_settings[SettingsKeys.SILERO_SPEECH_THRESHOLD.value])
+        except ValueError:
+            # default it to value in DEFAULT_SETTINGS_TABLE on invalid error
+            speech_prob_threshold = app_settings.DEFAULT_SETTINGS_TABLE[SettingsKeys.SILERO_SPEECH_THRESHOLD.value]
+            logger.info(f"Invalid value for SILERO_SPEECH_THRESHOLD: {app_settings.editable_settings[SettingsKeys.SILERO_SPEECH_THRESHOLD.value]}. Defaulting to {speech_prob_threshold}")
+
         stream, stream_exception = open_microphone_stream()
 
         if stream is None:
@@ -606,15 +616,6 @@ def record_audio():
                 # Check for silence
                 audio_buffer = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768
 
-                # convert the setting from str to float
-                try:
-                    speech_prob_threshold = float(
-                        app_settings.editable_settings[SettingsKeys.SILERO_SPEECH_THRESHOLD.value])
-                except ValueError:
-                    # default it to value in DEFAULT_SETTINGS_TABLE on invalid error
-                    speech_prob_threshold = app_settings.DEFAULT_SETTINGS_TABLE[SettingsKeys.SILERO_SPEECH_THRESHOLD.value]
-                    logger.info(f"Invalid value for SILERO_SPEECH_THRESHOLD: {app_settings.editable_settings[SettingsKeys.SILERO_SPEECH_THRESHOLD.value]}. Defaulting to {speech_prob_threshold}")
-
                 if is_silent(audio_buffer, speech_prob_threshold ):
                     silent_duration += CHUNK / RATE
                     silent_warning_duration += CHUNK / RATE
@@ -690,18 +691,35 @@ def check_silence_warning(silence_duration):
         window.destroy_warning_bar()
 
 
-silero, _silero = torch.hub.load(repo_or_dir='snakers4/silero-vad', model='silero_vad')
+SILERO_MODEL = None
+SILERO_LOCK = threading.Lock()
+
+
+def get_silero_model():
+    """
+    Get the Silero VAD model, loading it on first use.
+
+    The model is no longer loaded at import time, so startup does not wait on
+    torch.hub. It is warmed up in the background once the UI is running.
+    """
+    global SILERO_MODEL
+    if SILERO_MODEL is None:
+        with SILERO_LOCK:
+            if SILERO_MODEL is None:
+                SILERO_MODEL, _ = torch.hub.load(repo_or_dir='snakers4/silero-vad', model='silero_vad')
+    return SILERO_MODEL
 
 
 def is_silent(data, threshold: float = 0.65):
     """Check if audio chunk contains speech using Silero VAD"""
-    # Convert audio data to tensor and ensure correct format
-    audio_tensor = torch.FloatTensor(data)
+    # Wrap the float32 chunk as a tensor without copying it
+    audio_tensor = torch.from_numpy(data)
     if audio_tensor.dim() == 2:
         audio_tensor = audio_tensor.mean(dim=1)
 
-    # Get speech probability
-    speech_prob = silero(audio_tensor, 16000).item()
+    # Get speech probability, skipping autograd bookkeeping since this runs for every chunk
+    with torch.inference_mode():
+        speech_prob = get_silero_model()(audio_tensor, 16000).item()
     return speech_prob < threshold
 
 
@@ -1326,8 +1344,7 @@ def save_notes_history():
 def display_text(text):
     def _display_text():
         response_display.scrolled_text.configure(state='normal')
-        response_display.scrolled_text.delete("1.0", tk.END)
-        response_display.scrolled_text.insert(tk.END, f"{text}\n")
+        response_display.scrolled_text.replace("1.0", tk.END, f"{text}\n")
         response_display.scrolled_text.configure(state='disabled')
     root.after(0, _display_text)
 
@@ -1348,10 +1365,10 @@ def update_gui_with_response(response_text):
         if app_settings.editable_settings[SettingsKeys.STORE_NOTES_LOCALLY.value]:
             save_notes_history()
 
-        # Update the timestamp listbox
-        timestamp_listbox.delete(0, tk.END)
-        for time, _, _ in response_history:
-            timestamp_listbox.insert(tk.END, time)
+        # Add only the new entry; the listbox mirrors response_history, newest first
+        timestamp_listbox.insert(0, timestamp)
+        # The old selection shifted down a row; clear it so no older note looks selected
+        timestamp_listbox.selection_clear(0, tk.END)
 
         safe_set_note_box(response_text)
         try:
@@ -1364,13 +1381,27 @@ def update_gui_with_response(response_text):
     root.after(0, lambda: action(response_text))
 
 
+# Delay before showing a selected note, so holding an arrow key only renders the row it stops on
+SHOW_RESPONSE_DEBOUNCE_MS = 50
+SHOW_RESPONSE_AFTER_ID = None
+
+
 def show_response(event):
-    global IS_FIRST_LOG
+    global IS_FIRST_LOG, SHOW_RESPONSE_AFTER_ID
 
     if IS_FIRST_LOG:
         return
 
-    selection = event.widget.curselection()
+    if SHOW_RESPONSE_AFTER_ID is not None:
+        root.after_cancel(SHOW_RESPONSE_AFTER_ID)
+    SHOW_RESPONSE_AFTER_ID = root.after(SHOW_RESPONSE_DEBOUNCE_MS, show_selected_response, event.widget)
+
+
+def show_selected_response(listbox):
+    global SHOW_RESPONSE_AFTER_ID
+    SHOW_RESPONSE_AFTER_ID = None
+
+    selection = listbox.curselection()
     if selection:
         index = selection[0]
         # set the regenerate note button
@@ -2245,6 +2276,9 @@ if utils.system.is_system_low_memory() and not app_settings.is_low_mem_mode():
 if (app_settings.editable_settings['Show Welcome Message']):
     window.show_welcome_message()
 
+# Load the voice activity model in the background so the first recording does not wait for it
+threading.Thread(target=get_silero_model, daemon=True).start()
+
 #Wait for the UI root to be intialized then load the model. If using local llm.
 # Do not load the models if low mem is activated.
 if not app_settings.is_low_mem_mode():
@@ -2252,26 +2286,48 @@ if not app_settings.is_low_mem_mode():
     if app_settings.editable_settings[SettingsKeys.LOCAL_LLM.value]:
         def on_cancel_llm_load():
             cancel_await_thread.set()
-        root.after(
-            100,
+            # wake await_models so it sees the cancel straight away
+            model_load_finished.set()
+        root.after_idle(
             lambda: (
                 ModelManager.setup_model(
                     app_settings=app_settings,
                     root=root,
-                    on_cancel=on_cancel_llm_load)))
+                    on_cancel=on_cancel_llm_load,
+                    # await_models keeps the menu locked until the Whisper model has loaded too
+                    unlock_settings_menu=False)))
 
     if app_settings.editable_settings[SettingsKeys.LOCAL_WHISPER.value]:
         # Inform the user that Local Whisper is being used for transcription
         print("Using Local Whisper for transcription.")
-        root.after(100, lambda: (load_model_with_loading_screen(root=root, app_settings=app_settings)))
+        root.after_idle(lambda: (load_model_with_loading_screen(root=root, app_settings=app_settings)))
 
 if app_settings.editable_settings[SettingsKeys.ENABLE_HALLUCINATION_CLEAN.value] and FeatureToggle.HALLUCINATION_CLEANING:
-    root.after(100, lambda: (
+    root.after_idle(lambda: (
         load_hallucination_cleaner_model(root, app_settings)))
 
-if app_settings.editable_settings[SettingsKeys.ENABLE_HALLUCINATION_CLEAN.value] and FeatureToggle.HALLUCINATION_CLEANING:
-    root.after(100, lambda: (
-        load_hallucination_cleaner_model(root, app_settings)))
+def show_model_loading_error(error_message, failed_models_str):
+    """
+    Tell the user that the models failed to load and unlock the settings menu. Must run on the Tk thread.
+
+    :param error_message: Why loading failed.
+    :type error_message: str
+    :param failed_models_str: The names of the models that failed, comma separated.
+    :type failed_models_str: str
+    """
+    try:
+        messagebox.showerror(
+            "Model Loading Error",
+            f"{error_message}\n\n"
+            f"Failed models: {failed_models_str}\n\n"
+            "The settings menu has been re-enabled. Please check your configuration and try again."
+        )
+    except Exception as e:
+        logger.warning(f"Failed to show error notification dialog: {e}")
+    finally:
+        # Ensure settings menu is always enabled, regardless of success or failure
+        window.enable_settings_menu()
+
 
 # wait for both whisper and llm to be loaded before unlocking the settings button
 def await_models(timeout_length=60):
@@ -2280,109 +2336,108 @@ def await_models(timeout_length=60):
 
     The function checks if local models are enabled based on application settings.
     If a remote model is used, the corresponding flag is set to True immediately,
-    bypassing the wait. Otherwise, the function enters a loop that periodically
-    checks for model readiness and prints status updates until both models are loaded.
+    bypassing the wait. Otherwise, the function checks for model readiness each
+    time a model load finishes, until both models are loaded or timeout_length
+    seconds have passed.
+
+    Runs on a worker thread and sleeps on model_load_finished between checks, so
+    nothing polls while the models load. Cancelling the load sets
+    cancel_await_thread and wakes it. The settings menu is locked once before
+    waiting; menu changes are scheduled on the Tk thread.
 
+    :param timeout_length: Seconds to wait before reporting the models as failed.
+    :type timeout_length: int
     :return: None
     """
+    start_timer = time.time()
 
-    if not hasattr(await_models, "start_timer"):
-        await_models.start_timer = time.time()
+    # The settings menu stays locked while waiting, so these cannot change between checks
+    use_local_whisper = app_settings.editable_settings[SettingsKeys.LOCAL_WHISPER.value]
+    use_local_llm = app_settings.editable_settings[SettingsKeys.LOCAL_LLM.value]
+    low_mem_mode = app_settings.is_low_mem_mode()
 
-    # if we cancel this thread then break out of the loop
-    if cancel_await_thread.is_set():
-        logger.info("*** Model loading cancelled. Enabling settings bar.")
-        #reset the flag
-        cancel_await_thread.clear()
-        # reset the settings bar
-        window.enable_settings_menu()
-        # return so the .after() doesnt get called.
-        return
+    window.disable_settings_menu()
 
-    # if we are using remote whisper then we can assume it is loaded and dont wait
-    whisper_loaded = (not app_settings.editable_settings[SettingsKeys.LOCAL_WHISPER.value] or is_whisper_valid())
+    while True:
+        # Clear before checking, so a load finishing after the check still ends the wait below
+        model_load_finished.clear()
 
-    # if we are not using local llm then we can assume it is loaded and dont wait
-    llm_loaded = (not app_settings.editable_settings[SettingsKeys.LOCAL_LLM.value] or ModelManager.is_llm_valid())
+        # if we cancel this thread then break out of the loop
+        if cancel_await_thread.is_set():
+            logger.info("*** Model loading cancelled. Enabling settings bar.")
+            #reset the flag
+            cancel_await_thread.clear()
+            # reset the settings bar
+            window.enable_settings_menu()
+            return
 
-    # Check for errors in models
-    whisper_error = get_whisper_model() == WhisperModelStatus.ERROR
-    llm_error = ModelManager.local_model == ModelStatus.ERROR
+        # if we are using remote whisper then we can assume it is loaded and dont wait
+        whisper_loaded = (not use_local_whisper or is_whisper_valid())
 
-    logger.debug("*** Model loading status: ")
-    logger.debug(f"Whisper loaded: {whisper_loaded}, Whisper Error Status:{whisper_error}, LLM loaded: {llm_loaded}, LLM Error status: {llm_error}")
+        # if we are not using local llm then we can assume it is loaded and dont wait
+        llm_loaded = (not use_local_llm or ModelManager.is_llm_valid())
 
-    elapsed_time = time.time() - await_models.start_timer
-    
-    # Check if we should show error dialog (timeout OR any model error)
-    should_show_error = (elapsed_time >= timeout_length) or \
-        (whisper_error and llm_loaded) or \
-        (llm_error and whisper_loaded) or \
-        (llm_error and whisper_error)
+        # Check for errors in models
+        whisper_error = get_whisper_model() == WhisperModelStatus.ERROR
+        llm_error = ModelManager.local_model == ModelStatus.ERROR
+
+        logger.debug("*** Model loading status: ")
+        logger.debug(f"Whisper loaded: {whisper_loaded}, Whisper Error Status:{whisper_error}, LLM loaded: {llm_loaded}, LLM Error status: {llm_error}")
+
+        # stop waiting once both models are loaded
+        if (whisper_loaded and llm_loaded) or low_mem_mode:
+            break
 
-    # wait for both models to be loaded
-    if (not whisper_loaded or not llm_loaded) and not app_settings.is_low_mem_mode():
-        if math.floor(elapsed_time) % 5 == 0:
-            logger.info(f"Waiting for models to load. Loading timer: {math.floor(elapsed_time)}, Timeout:{timeout_length}")
+        elapsed_time = time.time() - start_timer
+
+        # Check if we should show error dialog (timeout OR any model error)
+        should_show_error = (elapsed_time >= timeout_length) or \
+            (whisper_error and llm_loaded) or \
+            (llm_error and whisper_loaded) or \
+            (llm_error and whisper_error)
 
         if should_show_error:
             # Gather diagnostic information about which models failed
             failed_models = []
-            if (not whisper_loaded and app_settings.editable_settings[SettingsKeys.LOCAL_WHISPER.value]) or whisper_error:
+            if (not whisper_loaded and use_local_whisper) or whisper_error:
                 failed_models.append("Whisper (STT)")
-            if (not llm_loaded and app_settings.editable_settings[SettingsKeys.LOCAL_LLM.value]) or llm_error:
+            if (not llm_loaded and use_local_llm) or llm_error:
                 failed_models.append("LLM")
-            
+
             failed_models_str = ', '.join(failed_models) if failed_models else 'Unknown'
-            
+
             if elapsed_time >= timeout_length:
                 error_message = f"Models failed to load within {timeout_length} seconds."
             else:
                 error_message = "One or more models failed to load due to errors."
-            
+
             logger.error(
                 f"{error_message} "
                 f"Failed models: {failed_models_str}. "
                 "Please check your settings."
             )
-            
-            try:
-                messagebox.showerror(
-                    "Model Loading Error",
-                    f"{error_message}\n\n"
-                    f"Failed models: {failed_models_str}\n\n"
-                    "The settings menu has been re-enabled. Please check your configuration and try again."
-                )
-            except Exception as e:
-                logger.warning(f"Failed to show error notification dialog: {e}")
-            finally:
-                # Ensure settings menu is always enabled, regardless of success or failure
-                window.enable_settings_menu()
+
+            root.after(0, show_model_loading_error, error_message, failed_models_str)
             return
 
-        try:
-            # override the lock in case something else tried to edit
-            window.disable_settings_menu()
-            root.after(1000, await_models)
-        except Exception as e:
-            logger.exception(f"Error in model loading loop: {e}")
-            # Ensure settings menu is enabled if there's an error
-            window.enable_settings_menu()
-            raise
-    else:
-        logger.info("*** Models loaded successfully on startup.")
+        logger.info(f"Waiting for models to load. Loading timer: {math.floor(elapsed_time)}, Timeout:{timeout_length}")
 
-        # if error null out the model
-        if ModelManager.local_model == ModelStatus.ERROR:
-            ModelManager.local_model = None
-        
-        if get_whisper_model() == WhisperModelStatus.ERROR:
-            set_whisper_model(None)
+        model_load_finished.wait(timeout_length - elapsed_time)
 
-        window.enable_settings_menu()
+    logger.info("*** Models loaded successfully on startup.")
+
+    # if error null out the model
+    if ModelManager.local_model == ModelStatus.ERROR:
+        ModelManager.local_model = None
+
+    if get_whisper_model() == WhisperModelStatus.ERROR:
+        set_whisper_model(None)
+
+    window.enable_settings_menu()
 
 
-root.after(100, await_models)
+# Start waiting once the model loads above have been kicked off
+root.after_idle(lambda: threading.Thread(target=await_models, daemon=True).start())
 
 root.bind("<<LoadSttModel>>", lambda e: load_stt_model(e, app_settings=app_settings))
 root.bind("<<UnloadSttModel>>", unload_stt_model)
@@ -52,8 +52,21 @@ def get_resource_path(filename: str, shared: bool = False) -> str:
         return os.path.join(_get_flatpak_data_dir(), filename)
     if not hasattr(sys, '_MEIPASS'):
         return os.path.abspath(filename)
-    base = _get_user_data_dir(shared)
-    freescribe_dir = os.path.join(base, 'FreeScribe')
+    return os.path.join(_get_freescribe_dir(shared), filename)
+
+
+@lru_cache(maxsize=None)
+def _get_freescribe_dir(shared: bool = False) -> str:
+    """
+    Get the FreeScribe directory inside the user data directory, creating it if needed.
+
+    The result is cached so the directory is only checked once per process.
+
+    :param shared: Whether to use the shared directory.
+    :return: The path to the FreeScribe directory.
+    :rtype: str
+    """
+    freescribe_dir = os.path.join(_get_user_data_dir(shared), 'FreeScribe')
 
     # Check if the FreeScribe directory exists, if not, create it
     try:
@@ -62,9 +75,10 @@ def get_resource_path(filename: str, shared: bool = False) -> str:
     except OSError as e:
         raise RuntimeError(f"Failed to create FreeScribe directory: {e}") from e
 
-    return os.path.join(freescribe_dir, filename)
+    return freescribe_dir
 
 
+@lru_cache(maxsize=None)
 def _get_user_data_dir(shared: bool = False) -> str:
     """
     Get the user data directory for the current platform.
@@ -0,0 +1,18 @@
+"""
+This software is released under the AGPL-3.0 license
+Copyright (c) 2023-2025 Braedon Hendy
+
+Further updates and packaging added in 2024-2025 through the ClinicianFOCUS initiative,
+a collaboration with Dr. Braedon Hendy and Conestoga College Institute of Applied
+Learning and Technology as part of the CNERG+ applied research project,
+Unburdening Primary Healthcare: An Open-Source AI Clinician Partner Platform".
+Prof. Michael Yingbull (PI), Dr. Braedon Hendy (Partner),
+and Research Students (Software Developers) -
+Alex Simko, Pemba Sherpa, Naitik Patel, Yogesh Kumar and Xun Zhong.
+"""
+
+import threading
+
+# Set whenever a local model (LLM or speech to text) finishes loading, whether it
+# succeeded or failed. Waiters clear it before checking the model statuses.
+model_load_finished = threading.Event()
@@ -33,6 +33,7 @@ import utils.whisper.Constants
 import UI.LoadingWindow
 import numpy as np
 from utils.log_config import logger
+from utils.model_events import model_load_finished
 from enum import Enum
 
 
@@ -85,6 +86,7 @@ def load_model_with_loading_screen(root, app_settings):
     except Exception as e:
         logger.exception("Failed to get model ID from settings")
         stt_local_model = WhisperModelStatus.ERROR
+        model_load_finished.set()
         return
     loading_screen = UI.LoadingWindow.LoadingWindow(
         root,
@@ -111,6 +113,8 @@ def load_stt_model(event=None, app_settings=None):
     """
     Initialize speech-to-text model loading in a separate thread.
 
+    Sets model_load_finished when the load ends, whether it succeeded or failed.
+
     Args:
         event: Optional event parameter for binding to tkinter events.
     """
@@ -121,7 +125,14 @@ def load_stt_model(event=None, app_settings=None):
         load_func = _load_stt_model_macos
     else:
         raise NotImplementedError(f"Unsupported platform: {platform.system()}")
-    thread = threading.Thread(target=load_func, args=(app_settings,))
+
+    def load():
+        try:
+            load_func(app_settings)
+        finally:
+            model_load_finished.set()
+
+    thread = threading.Thread(target=load)
     thread.start()
     return thread
 
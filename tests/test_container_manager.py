@@ -0,0 +1,163 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import ContainerManager as container_manager_module
+from ContainerManager import ContainerManager, ContainerState
+
+
+def make_container(name: str, status: str) -> SimpleNamespace:
+    """
+    Build a stand-in for a docker container as returned by ``containers.list``.
+
+    :param name: The container name
+    :param status: The container status, e.g. ``"running"`` or ``"exited"``
+    :return: An object with ``name`` and ``status`` attributes
+    """
+    return SimpleNamespace(name=name, status=status)
+
+
+def make_event(name, action: str) -> dict:
+    """
+    Build a decoded docker container event.
+
+    :param name: The container name, or None for an event without one
+    :param action: The event action, e.g. ``"start"``
+    :return: The event as the docker event stream decodes it
+    """
+    attributes = {} if name is None else {"name": name}
+    return {"Type": "container", "Action": action, "Actor": {"Attributes": attributes}}
+
+
+@pytest.fixture
+def client():
+    """Create a stub docker client with no containers and no events."""
+    stub = MagicMock()
+    stub.containers.list.return_value = []
+    stub.events.return_value = []
+    return stub
+
+
+@pytest.fixture
+def manager(client):
+    """Create a ContainerManager that talks to the stub client."""
+    with patch.object(container_manager_module, "_get_shared_client", return_value=client):
+        return ContainerManager()
+
+
+def test_check_containers_status_matches_names_exactly(manager, client):
+    """The daemon's substring name filter must not leak into the result."""
+    client.containers.list.return_value = [
+        make_container("ollama-extra", "running"),
+        make_container("ollama", "exited"),
+        make_container("speech2text", "running"),
+    ]
+
+    statuses = manager.check_containers_status(["ollama", "speech2text"])
+
+    assert statuses == {"ollama": False, "speech2text": True}
+    client.containers.list.assert_called_once_with(all=True, filters={"name": ["ollama", "speech2text"]})
+
+
+def test_check_containers_status_reports_missing_containers_as_stopped(manager, client):
+    client.containers.list.return_value = [make_container("ollama", "running")]
+
+    assert manager.check_containers_status(["ollama", "speech2text"]) == {"ollama": True, "speech2text": False}
+
+
+def test_check_containers_status_reports_stopped_on_error(manager, client):
+    client.containers.list.side_effect = Exception("daemon went away")
+
+    assert manager.check_containers_status(["ollama"]) == {"ollama": False}
+
+
+def test_watch_events_seeds_states_from_container_list(manager, client):
+    """Status checks during the watch are answered from the listed states without the daemon."""
+    client.containers.list.return_value = [
+        make_container("ollama", "running"),
+        make_container("speech2text", "exited"),
+    ]
+    client.events.return_value = [make_event("other", "start")]
+    seen = []
+
+    def callback(name, state):
+        seen.append(manager.check_containers_status(["ollama", "speech2text", "missing"]))
+
+    manager.watch_events(callback)
+
+    assert seen == [{"ollama": True, "speech2text": False, "missing": False}]
+    client.containers.list.assert_called_once_with(all=True)
+
+
+def test_watch_events_reports_start_stop_and_die(manager, client):
+    client.events.return_value = [
+        make_event("ollama", "start"),
+        make_event("ollama", "stop"),
+        make_event("speech2text", "start"),
+        make_event("speech2text", "die"),
+    ]
+    callback = MagicMock()
+
+    manager.watch_events(callback)
+
+    assert [c.args for c in callback.call_args_list] == [
+        ("ollama", ContainerState.CONTAINER_STARTED),
+        ("ollama", ContainerState.CONTAINER_STOPPED),
+        ("speech2text", ContainerState.CONTAINER_STARTED),
+        ("speech2text", ContainerState.CONTAINER_STOPPED),
+    ]
+
+
+def test_watch_events_tracks_state_changes(manager, client):
+    client.containers.list.return_value = [make_container("ollama", "exited")]
+    client.events.return_value = [make_event("ollama", "start")]
+    seen = []
+
+    manager.watch_events(lambda name, state: seen.append(manager.check_container_status(name)))
+
+    assert seen == [True]
+
+
+def test_watch_events_ignores_events_without_a_name(manager, client):
+    client.events.return_value = [make_event(None, "start"), make_event("ollama", "stop")]
+    callback = MagicMock()
+
+    manager.watch_events(callback)
+
+    callback.assert_called_once_with("ollama", ContainerState.CONTAINER_STOPPED)
+
+
+def test_watch_events_clears_tracked_state_when_the_stream_ends(manager, client):
+    client.containers.list.return_value = [make_container("ollama", "running")]
+    client.events.return_value = [make_event("ollama", "start")]
+
+    manager.watch_events(MagicMock())
+
+    assert manager._event_stream is None
+    assert manager._container_states is None
+
+
+def test_watch_events_clears_tracked_state_when_the_stream_fails(manager, client):
+    def failing_stream():
+        yield make_event("ollama", "start")
+        raise Exception("daemon went away")
+
+    client.events.return_value = failing_stream()
+    callback = MagicMock()
+
+    manager.watch_events(callback)
+
+    callback.assert_called_once_with("ollama", ContainerState.CONTAINER_STARTED)
+    assert manager._event_stream is None
+    assert manager._container_states is None
+
+
+def test_watch_events_without_client_returns_immediately(client):
+    with patch.object(container_manager_module, "_get_shared_client", return_value=None):
+        manager = ContainerManager()
+    callback = MagicMock()
+
+    manager.watch_events(callback)
+
+    callback.assert_not_called()
+    client.events.assert_not_called()